@@ -4,6 +4,9 @@ import io
 import json
 import secrets
 import logging
+import queue
+import atexit
+from logging.handlers import QueueHandler, QueueListener
 import hmac
 from functools import wraps
 from flask import Flask, Blueprint, request, send_from_directory, Response, url_for, send_file
@@ -12,9 +15,7 @@ from markdown import markdown
 import bleach
 from decouple import config
 from openai import OpenAI
-from pymongo import MongoClient
 from pymongo import ReturnDocument
-from pymongo.server_api import ServerApi
 from bson import ObjectId
 import boto3
 import requests
@@ -26,7 +27,7 @@ import threading
 from conversation_service import ConversationService
 from scraping_service import ScrapingService
 from scrape_scheduler import ScrapeScheduler
-from assistant_services import ScraperClient
+from assistant_services import ScraperClient, build_sqs_client, get_mongo_client
 from packages.common.scraper_contracts import ScraperQueueConfig
 from document_intelligence_service import DocumentIntelligenceService
 from tools import DocumentToolbox
@@ -38,7 +39,13 @@ from functions import (
 )
 from tools.mongo_audit import AuditedDatabase, set_current_actor
 
-logging.basicConfig(level=logging.INFO)
+# Handlers only enqueue log records; a single background listener does the (blocking)
+# stream writes so request threads never wait on stdout.
+_log_queue = queue.SimpleQueue()
+_log_listener = QueueListener(_log_queue, logging.StreamHandler(), respect_handler_level=True)
+logging.basicConfig(level=logging.INFO, handlers=[QueueHandler(_log_queue)])
+_log_listener.start()
+atexit.register(_log_listener.stop)
 logger = logging.getLogger(__name__)
 
 if not config("OPENAI_API_KEY"):
@@ -47,10 +54,10 @@ if not config("OPENAI_API_KEY"):
 client = OpenAI(api_key=config("OPENAI_API_KEY"))
 VECTOR_STORE_ID = config("OPENAI_VECTOR_STORE_ID", default=None)
 
-mongo_client = MongoClient(config("MONGO_URI"), server_api=ServerApi("1"))
+mongo_client = get_mongo_client()
 try:
     mongo_client.admin.command("ping")
-    print("MongoDB connection successful.")
+    logger.info("MongoDB connection successful.")
 
 except Exception as e:
     raise RuntimeError(f"Failed to connect to MongoDB: {e}")
@@ -68,6 +75,21 @@ blocked_pages_collection = db.get_collection("blocked_pages")
 api_tokens_collection = db.get_collection("api_tokens")
 tequila_draw_entries_collection = db.get_collection("tequila_draw_entries")
 
+# Create indexes for the admin handlers' hot lookups
+try:
+    modes_collection.create_index([("name", 1), ("user_id", 1)])
+    scraped_content_collection.create_index([("user_id", 1), ("modes", 1)])
+    scraping_jobs_collection.create_index([("mode_id", 1), ("status", 1), ("created_at", -1)])
+    scraping_jobs_collection.create_index([("user_id", 1), ("mode_name", 1), ("created_at", -1)])
+    scraping_jobs_collection.create_index([("user_id", 1), ("created_at", -1)])
+    # Enqueue-time duplicate checks on content-scoped jobs (refresh/delete).
+    scraping_jobs_collection.create_index(
+        [("content_id", 1), ("job_type", 1), ("status", 1)],
+        partialFilterExpression={"content_id": {"$exists": True}},
+    )
+except Exception:  # noqa: BLE001
+    pass  # Indexes may already exist
+
 localDevMode = config("LOCAL_DEV_MODE", default="false").lower()
 
 if not localDevMode == "true" and config("SCRAPER_ENVIRONMENT", default="dev") == "prod":
@@ -109,6 +131,7 @@ DOC_INTEL_ALLOWED_EXTENSIONS = set(
     if ext.strip()
 )
 DOC_INTEL_EXPIRY_MINUTES = int(config("DOC_INTEL_EXPIRY_MINUTES", default="30"))
+DOC_INTEL_MAX_TEXT_MB = int(config("DOC_INTEL_MAX_TEXT_MB", default="5"))
 
 def _log_access_denied(action: str, *, mode_id=None, content_id=None, mode_owner_id=None, content_owner_id=None, extra=None):
     """Log consistent auth debug info to help diagnose 403s (especially mixed user_id types in Mongo)."""
@@ -133,6 +156,63 @@ def _log_access_denied(action: str, *, mode_id=None, content_id=None, mode_owner
         logger.warning("ACCESS_DENIED_LOG_FAILED action=%s error=%s", action, str(exc))
 
 
+_MODE_AUTHZ_CACHE = {}
+_MODE_AUTHZ_CACHE_LOCK = threading.Lock()
+_MODE_AUTHZ_CACHE_TTL_SECONDS = 15
+_MODE_AUTHZ_CACHE_MAX_ENTRIES = 1024
+
+
+def _get_mode_for_authz(mode_obj_id):
+    """
+    Fetch the minimal mode fields used for access checks, with a short-TTL per-process cache.
+
+    UI polling hits the same modes repeatedly; up to a few seconds of staleness is fine for
+    this read-mostly metadata. Handlers that write these fields call `_invalidate_mode_authz`.
+    """
+    key = str(mode_obj_id)
+    now = datetime.utcnow()
+    with _MODE_AUTHZ_CACHE_LOCK:
+        cached = _MODE_AUTHZ_CACHE.get(key)
+        if cached:
+            if (now - cached["created_at"]).total_seconds() <= _MODE_AUTHZ_CACHE_TTL_SECONDS:
+                return cached["doc"]
+            _MODE_AUTHZ_CACHE.pop(key, None)
+
+    mode_doc = modes_collection.find_one(
+        {"_id": mode_obj_id},
+        {"user_id": 1, "name": 1, "blocked_page_urls": 1},
+    )
+    if mode_doc:
+        with _MODE_AUTHZ_CACHE_LOCK:
+            if len(_MODE_AUTHZ_CACHE) >= _MODE_AUTHZ_CACHE_MAX_ENTRIES:
+                _MODE_AUTHZ_CACHE.clear()
+            _MODE_AUTHZ_CACHE[key] = {"doc": mode_doc, "created_at": now}
+    return mode_doc
+
+
+def _invalidate_mode_authz(mode_obj_id) -> None:
+    with _MODE_AUTHZ_CACHE_LOCK:
+        _MODE_AUTHZ_CACHE.pop(str(mode_obj_id), None)
+
+
+def _user_id_variants(user_id) -> list:
+    """
+    Return every stored form a user_id may take (raw, str, ObjectId) for use in `$in` filters.
+
+    Older data may store ids as non-strings; matching all variants server-side lets the
+    query use the user_id index instead of comparing `str()` forms in Python.
+    """
+    if user_id is None:
+        return [None]
+    variants = [user_id]
+    user_id_str = str(user_id)
+    if user_id_str != user_id:
+        variants.append(user_id_str)
+    if not isinstance(user_id, ObjectId) and len(user_id_str) == 24 and ObjectId.is_valid(user_id_str):
+        variants.append(ObjectId(user_id_str))
+    return variants
+
+
 def _vector_share_key_for_mode(mode_name: str) -> str:
     """Match ConversationService/ScrapingService shared-with attribute key derivation."""
     raw = (mode_name or "").strip().lower()
@@ -188,7 +268,7 @@ def _detach_vector_store_file_from_mode(
         )
         return True
     except Exception as e:  # noqa: BLE001
-        print(f"Warning: could not detach vector file {file_id} from mode '{removed_mode}': {e}")
+        logger.warning("could not detach vector file %s from mode '%s': %s", file_id, removed_mode, e)
         return False
 
 
@@ -258,6 +338,7 @@ doc_intelligence_service = DocumentIntelligenceService(
     storage_dir=DOC_INTEL_STORAGE_DIR,
     toolbox=document_toolbox,
     expiry_minutes=DOC_INTEL_EXPIRY_MINUTES,
+    max_text_bytes=DOC_INTEL_MAX_TEXT_MB * 1024 * 1024,
 ) if DOC_INTEL_ENABLED else None
 
 conversation_service = ConversationService(
@@ -267,6 +348,7 @@ conversation_service = ConversationService(
     VECTOR_STORE_ID,
     doc_intelligence_service=doc_intelligence_service,
     document_intelligence_enabled=DOC_INTEL_ENABLED,
+    speculative_upgrade=config("CONVERSATION_SPECULATIVE_UPGRADE", default="false").lower() == "true",
 )
 
 SCRAPER_EXECUTION_MODE = config("SCRAPER_EXECUTION_MODE", default="local").lower()
@@ -274,6 +356,7 @@ SCRAPER_ENVIRONMENT = config("SCRAPER_ENVIRONMENT", default="prod")
 SCRAPER_SQS_QUEUE_URL = config("SCRAPER_SQS_QUEUE_URL", default=None)
 SCRAPER_SQS_REGION = config("SCRAPER_SQS_REGION", default=COGNITO_REGION or "us-east-1")
 SCRAPER_SQS_MESSAGE_GROUP_ID = config("SCRAPER_SQS_MESSAGE_GROUP_ID", default=None)
+SCRAPER_SQS_BATCH_WINDOW_MS = int(config("SCRAPER_SQS_BATCH_WINDOW_MS", default="0"))
 
 scraping_service = None
 scraper_client = None
@@ -294,16 +377,16 @@ else:
     if not SCRAPER_SQS_QUEUE_URL:
         raise RuntimeError("SCRAPER_SQS_QUEUE_URL is required when SCRAPER_EXECUTION_MODE='remote'")
 
-    sqs_client = boto3.client(
-        "sqs",
+    sqs_client = build_sqs_client(
+        SCRAPER_SQS_REGION,
         aws_access_key_id=AWS_ACCESS_KEY_ID,
         aws_secret_access_key=AWS_SECRET_ACCESS_KEY,
-        region_name=SCRAPER_SQS_REGION,
     )
     queue_config = ScraperQueueConfig(
         queue_url=SCRAPER_SQS_QUEUE_URL,
         region_name=SCRAPER_SQS_REGION,
         message_group_id=SCRAPER_SQS_MESSAGE_GROUP_ID or None,
+        batch_window_ms=SCRAPER_SQS_BATCH_WINDOW_MS or None,
     )
     scraper_client = ScraperClient(
         mode="remote",
@@ -313,6 +396,8 @@ else:
         queue_config=queue_config,
     )
 
+atexit.register(scraper_client.close)
+
 scrape_scheduler = ScrapeScheduler(
     modes_collection,
     scraping_jobs_collection,
@@ -407,7 +492,7 @@ def token_auth_required(fn):
         try:
             token_hash = _hash_api_token(token)
         except Exception as e:  # noqa: BLE001
-            print(f"API token auth misconfigured: {e}")
+            logger.warning("API token auth misconfigured: %s", e)
             return {"error": "Token auth not configured"}, 500
 
         token_doc = api_tokens_collection.find_one({"token_hash": token_hash})
@@ -422,7 +507,7 @@ def token_auth_required(fn):
                     {"$set": {"token_hash": token_hash}, "$unset": {"token": ""}},
                 )
             except Exception as e:  # noqa: BLE001
-                print(f"Failed to migrate legacy api token doc: {e}")
+                logger.warning("Failed to migrate legacy api token doc: %s", e)
             token_doc = legacy
         if token_doc.get("active", True) is False:
             return {"error": "Unauthorized"}, 401
@@ -453,7 +538,7 @@ def token_auth_required(fn):
                 },
             )
         except Exception as e:  # noqa: BLE001
-            print(f"Error logging api token usage: {e}")
+            logger.exception("Error logging api token usage: %s", e)
 
         request.api_token = {
             "_id": str(token_doc.get("_id")),
@@ -509,8 +594,8 @@ def _verify_talentcentral_user_token():
     """
     token, token_source = _extract_talentcentral_user_token()
     if not token or not API_TOKEN_HMAC_SECRET:
-        print(
-            "TalentCentral token not available for verification",
+        logger.info(
+            "TalentCentral token not available for verification %s",
             {
                 "token_source": token_source,
                 "has_secret": bool(API_TOKEN_HMAC_SECRET),
@@ -518,7 +603,7 @@ def _verify_talentcentral_user_token():
         )
         return None
 
-    print("TalentCentral token source", {"token_source": token_source})
+    logger.info("TalentCentral token source %s", {"token_source": token_source})
 
     try:
         claims = jwt.decode(
@@ -528,10 +613,10 @@ def _verify_talentcentral_user_token():
             options={"verify_aud": False},
         )
     except ExpiredSignatureError:
-        print("TalentCentral user token expired.")
+        logger.warning("TalentCentral user token expired.")
         return None
     except JWTError as e:
-        print(f"TalentCentral user token invalid: {e}")
+        logger.warning("TalentCentral user token invalid: %s", e)
         return None
 
     uid = claims.get("uid")
@@ -539,8 +624,8 @@ def _verify_talentcentral_user_token():
     if not uid_text:
         return None
 
-    print(
-        "TalentCentral token decoded claims",
+    logger.info(
+        "TalentCentral token decoded claims %s",
         {
             "uid": uid_text,
             "role": claims.get("role"),
@@ -577,7 +662,7 @@ def _resolve_api_token_user_id():
     try:
         token_hash = _hash_api_token(token)
     except Exception as e:  # noqa: BLE001
-        print(f"API token hash failed in /ask fallback: {e}")
+        logger.warning("API token hash failed in /ask fallback: %s", e)
         return None
 
     token_doc = api_tokens_collection.find_one({"token_hash": token_hash})
@@ -621,7 +706,7 @@ def _list_talentcentral_test_users(limit=200):
             if row.get("id") is not None
         ]
     except Exception as e:  # noqa: BLE001
-        print(f"Failed to list TalentCentral test users: {e}")
+        logger.warning("Failed to list TalentCentral test users: %s", e)
         return []
     finally:
         try:
@@ -885,7 +970,6 @@ def upload_files():
             doc_intelligence_service.ingest_files(mode_doc, doc_intel_session_id, doc_intel_candidates)
         except Exception as exc:  # noqa: BLE001
             logger.error(f"Doc intelligence ingest failed: {exc}", exc_info=True)
-            print(f"Doc intelligence ingest failed: {exc}")
     
     return {"file_ids": file_ids}
 
@@ -901,9 +985,9 @@ def clear_conversation():
         for file_id in file_ids:
             try:
                 client.files.delete(file_id)
-                print(f"Deleted file: {file_id}")
+                logger.info("Deleted file: %s", file_id)
             except Exception as e:  # noqa: BLE001
-                print(f"Failed to delete file {file_id}: {e}")
+                logger.warning("Failed to delete file %s: %s", file_id, e)
     
     return {"status": "cleared"}
 
@@ -934,7 +1018,7 @@ def ask():
         conversation_id = str(ObjectId())
     
     ip_addr = request.headers.get("X-Forwarded-For", request.remote_addr)
-    print(f"Prompt sent from IP: {ip_addr}")
+    logger.info("Prompt sent from IP: %s", ip_addr)
     
     # Log the user prompt
     threading.Thread(
@@ -955,17 +1039,15 @@ def ask():
             if token_claims:
                 user_id = token_claims.get("uid", "anonymous")
                 role = token_claims.get("role") or "unknown"
-                print(
-                    f"TalentCentral /ask auth_source=token-user user_id={user_id} role={role}"
-                )
+                logger.info("TalentCentral /ask auth_source=token-user user_id=%s role=%s", user_id, role)
             else:
                 api_token_user_id = _resolve_api_token_user_id()
                 if api_token_user_id:
                     user_id = api_token_user_id
-                    print(f"TalentCentral /ask auth_source=api-token user_id={user_id}")
+                    logger.info("TalentCentral /ask auth_source=api-token user_id=%s", user_id)
                 else:
                     user_id = "anonymous"
-                    print("TalentCentral /ask auth_source=guest user_id=anonymous")
+                    logger.info("TalentCentral /ask auth_source=guest user_id=anonymous")
         gpt_text, response_id, _usage = conversation_service.respond(
             conversation_id=conversation_id,
             user_id=user_id,
@@ -1021,7 +1103,7 @@ def ask():
 
         return html
     except Exception as err:  # noqa: BLE001
-        print("Error getting AI response:", err)
+        logger.exception("Error getting AI response: %s", err)
         return (
             '<div class="chat-entry assistant">'
             '<div class="bubble">❌ There was an error getting a response. Please try again.</div>'
@@ -1064,7 +1146,7 @@ def get_mode(mode):
 @cognito_auth_required
 def list_modes_admin():
     docs = []
-    print("Listing modes for user:", request.user["sub"])
+    logger.info("Listing modes for user: %s", request.user["sub"])
     if request.user.get("is_super_admin"):
         cursor = modes_collection.find({})
     else:
@@ -1195,6 +1277,8 @@ def update_mode(mode_id):
         update["database"] = data.get("database")
     
     modes_collection.update_one({"_id": doc["_id"]}, {"$set": update, "$unset": {"prioritize_files": ""}})
+    _invalidate_mode_authz(doc["_id"])
+    conversation_service.invalidate_mode(doc.get("name"))
     doc.update(update)
     doc["_id"] = str(doc["_id"])
     doc.pop("user_id", None)
@@ -1239,14 +1323,14 @@ def delete_mode(mode_id):
                 try:
                     s3.delete_object(Bucket=S3_BUCKET, Key=key)
                 except Exception as e:  # noqa: BLE001
-                    print("s3 delete failed", e)
+                    logger.warning("s3 delete failed: %s", e)
             
             # Delete from OpenAI
             if document.get("openai_file_id"):
                 try:
                     client.files.delete(document["openai_file_id"])
                 except Exception as e:  # noqa: BLE001
-                    print("openai file delete failed", e)
+                    logger.warning("openai file delete failed: %s", e)
                 
                 # Delete from vector store
                 if VECTOR_STORE_ID:
@@ -1255,13 +1339,15 @@ def delete_mode(mode_id):
                             vector_store_id=VECTOR_STORE_ID, file_id=document["openai_file_id"]
                         )
                     except Exception as e:  # noqa: BLE001
-                        print("vector store delete failed", e)
+                        logger.warning("vector store delete failed: %s", e)
         
         # Delete all documents from database
         documents_collection.delete_many(doc_query)
     
     # Delete the mode
     modes_collection.delete_one({"_id": doc["_id"]})
+    _invalidate_mode_authz(doc["_id"])
+    conversation_service.invalidate_mode(doc.get("name"))
     
     return {"success": True, "message": "Mode and all associated documents deleted"}, 200
 
@@ -1291,7 +1377,7 @@ def admin_login():
         cognito.close()
         return {"error": "Invalid credentials"}, 401
     except Exception as e:  # noqa: BLE001
-        print("cognito login failed", e)
+        logger.warning("cognito login failed: %s", e)
         cognito.close()
         return {"error": "Login failed"}, 500
     auth = resp.get("AuthenticationResult", {})
@@ -1320,10 +1406,10 @@ def admin_forgot_password_initiate():
     if not username:
         return {"error": "Username is required"}, 400
     if not (COGNITO_REGION and COGNITO_APP_CLIENT_ID and COGNITO_USER_POOL_ID):
-        print("Cognito not configured")
+        logger.warning("Cognito not configured")
         return {"error": "Cognito not configured"}, 500
     if not SES_SENDER_EMAIL:
-        print("SES not configured")
+        logger.warning("SES not configured")
         return {"error": "SES not configured"}, 500
     
     cognito = boto3.client("cognito-idp", region_name=COGNITO_REGION, aws_access_key_id=AWS_ACCESS_KEY_ID, aws_secret_access_key=AWS_SECRET_ACCESS_KEY)
@@ -1343,14 +1429,14 @@ def admin_forgot_password_initiate():
                     break
             
             if not email:
-                print(f"No email found for user: {username}")
+                logger.info("No email found for user: %s", username)
                 user_exists = False
             else:
                 user_exists = True
         except cognito.exceptions.UserNotFoundException:
             # User doesn't exist, but we'll still return success (security best practice)
             user_exists = False
-            print(f"Password reset requested for non-existent user: {username}")
+            logger.warning("Password reset requested for non-existent user: %s", username)
         
         if user_exists:
             # Generate secure token
@@ -1376,7 +1462,7 @@ def admin_forgot_password_initiate():
                 reset_tokens_collection.create_index('expires_at', expireAfterSeconds=0)
             except Exception:  # noqa: BLE001
                 # Indexes might already exist
-                print("Failed to create indexes")
+                logger.warning("Failed to create indexes")
                 pass
             
             # Generate reset link
@@ -1386,10 +1472,10 @@ def admin_forgot_password_initiate():
             # Send email via SES
             try:
                 response = _send_password_reset_email(email, reset_link, token_expiry_minutes=15)
-                print(f"Password reset email sent successfully to {email}")
-                print(f"SES MessageId: {response['MessageId']}")
+                logger.info("Password reset email sent successfully to %s", email)
+                logger.info("SES MessageId: %s", response['MessageId'])
             except Exception as e:  # noqa: BLE001
-                print(f"Failed to send password reset email to {email}: {e}")
+                logger.warning("Failed to send password reset email to %s: %s", email, e)
                 # Still return success to avoid information leakage
         
         # Always return success (don't reveal if user exists or not)
@@ -1397,7 +1483,7 @@ def admin_forgot_password_initiate():
         return {"status": "success"}, 200
         
     except Exception as e:  # noqa: BLE001
-        print(f"Password reset initiation failed: {e}")
+        logger.warning("Password reset initiation failed: %s", e)
         cognito.close()
         # Still return success to avoid information leakage
         return {"status": "success"}, 200
@@ -1428,9 +1514,9 @@ def admin_reset_password_with_token():
         
         # Get user email from token
         user_email = token_doc.get("email")
-        print("user_email", user_email)
+        logger.info("user_email: %s", user_email)
         username = token_doc.get("username")
-        print("username", username)
+        logger.info("username: %s", username)
         
         if not user_email or not username:
             return {"error": "Invalid token data"}, 400
@@ -1446,7 +1532,7 @@ def admin_reset_password_with_token():
                 Password=new_password,
                 Permanent=True
             )
-            print("cognito admin_set_user_password successful")
+            logger.info("cognito admin_set_user_password successful")
         except cognito.exceptions.InvalidPasswordException as e:
             cognito.close()
             error_message = str(e)
@@ -1456,7 +1542,7 @@ def admin_reset_password_with_token():
             return {"error": "User not found"}, 404
         except Exception as e:  # noqa: BLE001
             cognito.close()
-            print(f"Cognito admin_set_user_password failed: {e}")
+            logger.warning("Cognito admin_set_user_password failed: %s", e)
             return {"error": "Failed to reset password. Please try again."}, 500
         
         cognito.close()
@@ -1466,11 +1552,11 @@ def admin_reset_password_with_token():
             {"$set": {"used": True, "used_at": datetime.utcnow()}}
         )
         
-        print(f"Password reset successful for user: {user_email}")
+        logger.info("Password reset successful for user: %s", user_email)
         return {"status": "success", "message": "Password reset successful"}, 200
         
     except Exception as e:  # noqa: BLE001
-        print(f"Token-based password reset failed: {e}")
+        logger.warning("Token-based password reset failed: %s", e)
         return {"error": "Password reset failed. Please try again."}, 500
 
 
@@ -1496,7 +1582,7 @@ def refresh_token():
         return {"error": "Invalid refresh token"}, 401
     except Exception as e:  # noqa: BLE001
         cognito.close()
-        print("cognito refresh failed", e)
+        logger.warning("cognito refresh failed: %s", e)
         return {"error": "Token refresh failed"}, 500
     
     auth = resp.get("AuthenticationResult", {})
@@ -1534,7 +1620,7 @@ def permitsca_api():
         conversation_id = str(ObjectId())
     
     ip_addr = request.headers.get("X-Forwarded-For", request.remote_addr)
-    print(f"Permitsca API prompt sent from IP: {ip_addr}")
+    logger.info("Permitsca API prompt sent from IP: %s", ip_addr)
     
     # Log the user prompt
     threading.Thread(
@@ -1586,7 +1672,7 @@ def permitsca_api():
             "tag": tag,
         }
     except Exception as err:  # noqa: BLE001
-        print("Error getting AI response:", err)
+        logger.exception("Error getting AI response: %s", err)
         return {"error": "There was an error getting a response. Please try again."}, 500
 
 
@@ -1613,7 +1699,7 @@ def talentcentral_api():
         conversation_id = str(ObjectId())
 
     ip_addr = request.headers.get("X-Forwarded-For", request.remote_addr)
-    print(f"TalentCentral API prompt sent from IP: {ip_addr}")
+    logger.info("TalentCentral API prompt sent from IP: %s", ip_addr)
 
     threading.Thread(
         target=_async_log_prompt,
@@ -1660,7 +1746,7 @@ def talentcentral_api():
             "user_id": user_id,
         }
     except Exception as err:  # noqa: BLE001
-        print("Error getting TalentCentral API response:", err)
+        logger.exception("Error getting TalentCentral API response: %s", err)
         return {"error": "There was an error getting a response. Please try again."}, 500
 
 
@@ -1810,7 +1896,7 @@ def tequila_draw_create_entry():
     try:
         result = tequila_draw_entries_collection.insert_one(entry_doc)
     except Exception as e:  # noqa: BLE001
-        print(f"Failed to insert tequila draw entry: {e}")
+        logger.warning("Failed to insert tequila draw entry: %s", e)
         return {"error": "Failed to store entry"}, 500
 
     return {"status": "ok", "entry_id": str(result.inserted_id)}, 201
@@ -1878,7 +1964,7 @@ def scrape_target_api():
             )
             return {"status": "queued", "job_id": str(job_id)}, 202
         except Exception as e:  # noqa: BLE001
-            print(f"Error queueing api_target_scrape job: {e}")
+            logger.exception("Error queueing api_target_scrape job: %s", e)
             return {"error": "Failed to queue job", "details": str(e)}, 500
 
     # Sync path: run immediately and (optionally) persist a job doc for inspectability
@@ -1891,7 +1977,7 @@ def scrape_target_api():
                 VECTOR_STORE_ID,
             )
         except Exception as e:  # noqa: BLE001
-            print(f"Error initializing scraping_service for sync scrape-target: {e}")
+            logger.exception("Error initializing scraping_service for sync scrape-target: %s", e)
             return {"error": "Scraping service not available", "details": str(e)}, 500
 
     job_doc = {
@@ -1948,7 +2034,7 @@ def scrape_target_api():
             {"_id": job_id},
             {"$set": {"status": "failed", "error": str(e), "completed_at": datetime.utcnow()}},
         )
-        print(f"Error running sync scrape-target: {e}")
+        logger.exception("Error running sync scrape-target: %s", e)
         return {"error": "Failed to scrape target", "details": str(e), "job_id": str(job_id)}, 500
 
 
@@ -2044,11 +2130,11 @@ def admin_analytics_summary():
                 mode_doc = modes_collection.find_one({"_id": ObjectId(mode_id)})
                 mode_title = mode_doc.get("title") or mode_doc.get("name") if mode_doc else "Unknown"
             except Exception as e:
-                print(f"Error converting mode ID to title: {e}")
+                logger.exception("Error converting mode ID to title: %s", e)
                 mode_title = "Unknown"
         else:
             mode_title = "Unknown"
-            print("Mode ID is None")
+            logger.info("Mode ID is None")
         
         top_modes.append({
             "mode": mode_title,
@@ -2140,7 +2226,7 @@ def admin_analytics_summary():
                 "title": mode_title
             })
         except Exception as e:
-            print(f"Error converting mode ID to title: {e}")
+            logger.exception("Error converting mode ID to title: %s", e)
             available_modes.append({
                 "id": mode_id,
                 "title": "Unknown"
@@ -2214,7 +2300,7 @@ def admin_analytics_search():
         result = _process_natural_language_query(query, pipeline, prompt_match, client, prompt_logs_collection, modes_collection)
         return result
     except Exception as e:
-        print(f"Error processing natural language query: {e}")
+        logger.exception("Error processing natural language query: %s", e)
         return {"error": "Unable to process your question. Please try rephrasing it."}, 500
 
 
@@ -2289,7 +2375,7 @@ def admin_analytics_conversations():
             mode_doc = modes_collection.find_one({"_id": ObjectId(mode_id)})
             title = mode_doc.get("title") or mode_doc.get("name") if mode_doc else "Unknown"
         except Exception as e:
-            print(f"Error converting mode ID to title: {e}")
+            logger.exception("Error converting mode ID to title: %s", e)
         mode_title_cache[mode_id] = title
         return title
 
@@ -2357,7 +2443,7 @@ def admin_analytics_conversation_prompts(conversation_id):
                     mode_title = mode_doc.get("title") or mode_doc.get("name") if mode_doc else "Unknown"
                 except Exception as e:
                     mode_title = "Unknown"
-                    print(f"Error converting mode ID to title: {e}")
+                    logger.exception("Error converting mode ID to title: %s", e)
             
             prompts.append({
                 "prompt": doc.get("prompt", ""),
@@ -2368,7 +2454,7 @@ def admin_analytics_conversation_prompts(conversation_id):
         
         return {"prompts": prompts}
     except Exception as e:
-        print(f"Error fetching conversation prompts: {e}")
+        logger.exception("Error fetching conversation prompts: %s", e)
         return {"error": "Failed to fetch conversation prompts"}, 500
 
 
@@ -2440,11 +2526,11 @@ def superadmin_overview():
                             email = attr["Value"]
                             break
                 else:
-                    print(f"User not found in Cognito: {user_id}")
+                    logger.info("User not found in Cognito: %s", user_id)
                     username = f"Unknown ({user_id[:8]}...)"
                         
             except Exception as e:
-                print(f"Error fetching user from Cognito: {e}")
+                logger.exception("Error fetching user from Cognito: %s", e)
                 username = f"Error ({user_id[:8]}...)"
             
             admin_users.append({
@@ -2467,7 +2553,7 @@ def superadmin_overview():
         }
         
     except Exception as e:
-        print(f"Error in superadmin_overview: {e}")
+        logger.exception("Error in superadmin_overview: %s", e)
         return {"error": "Failed to fetch admin overview"}, 500
 
 
@@ -2553,7 +2639,7 @@ def create_document():
                     attributes=vs_meta,
                 )
             except Exception as e:  # noqa: BLE001
-                print("vector store add failed", e)
+                logger.warning("vector store add failed: %s", e)
     doc = {
         "user_id": mode_owner_id,
         "mode": mode,
@@ -2595,19 +2681,19 @@ def delete_document(doc_id):
         try:
             s3.delete_object(Bucket=S3_BUCKET, Key=key)
         except Exception as e:  # noqa: BLE001
-            print("s3 delete failed", e)
+            logger.warning("s3 delete failed: %s", e)
     if doc.get("openai_file_id"):
         try:
             client.files.delete(doc["openai_file_id"])
         except Exception as e:  # noqa: BLE001
-            print("openai file delete failed", e)
+            logger.warning("openai file delete failed: %s", e)
         if VECTOR_STORE_ID:
             try:
                 client.vector_stores.files.delete(
                     vector_store_id=VECTOR_STORE_ID, file_id=doc["openai_file_id"]
                 )
             except Exception as e:  # noqa: BLE001
-                print("vector store delete failed", e)
+                logger.warning("vector store delete failed: %s", e)
     documents_collection.delete_one({"_id": doc["_id"]})
     
     # Check if there are any remaining files for this mode
@@ -2672,7 +2758,7 @@ def download_document(doc_id):
             ExpiresIn=300,
         )
     except Exception as e:  # noqa: BLE001
-        print("s3 presign failed", e)
+        logger.warning("s3 presign failed: %s", e)
         return {"error": "Failed to build download url"}, 500
 
     return {"download_url": download_url, "filename": filename}
@@ -2818,7 +2904,7 @@ def doc_intel_query_search():
         return html
         
     except Exception as exc:  # noqa: BLE001
-        print(f"Error in doc-intel-query-search: {exc}")
+        logger.exception("Error in doc-intel-query-search: %s", exc)
         return (
             '<div class="chat-entry assistant">'
             '<div class="bubble">❌ There was an error searching your documents. Please try again.</div>'
@@ -3063,7 +3149,7 @@ def trigger_scrape(mode_id):
         }, 202  # 202 Accepted
         
     except Exception as e:
-        print(f"Error triggering scrape: {e}")
+        logger.exception("Error triggering scrape: %s", e)
         return {"error": "Failed to trigger scraping", "details": str(e)}, 500
 
 
@@ -3110,6 +3196,19 @@ def get_scrape_status(mode_id):
     }
 
 
+# Static stages of the per-domain rollup; only the leading $match varies per request.
+_SCRAPED_SITES_PIPELINE_TAIL = (
+    {"$group": {
+        "_id": "$base_domain",
+        "total_pages": {"$sum": 1},
+        "total_words": {"$sum": "$metadata.word_count"},
+        "last_scraped": {"$max": "$scraped_at"},
+        "sample_url": {"$first": "$original_url"}
+    }},
+    {"$sort": {"last_scraped": -1}},
+)
+
+
 @routes.get("/admin/scrape/sites/<mode_id>")
 @cognito_auth_required
 def get_scraped_sites(mode_id):
@@ -3130,17 +3229,7 @@ def get_scraped_sites(mode_id):
         mode_name = mode_doc.get("name")
         
         # Aggregate content by base_domain
-        pipeline = [
-            {"$match": {"modes": mode_name, "status": "active"}},
-            {"$group": {
-                "_id": "$base_domain",
-                "total_pages": {"$sum": 1},
-                "total_words": {"$sum": "$metadata.word_count"},
-                "last_scraped": {"$max": "$scraped_at"},
-                "sample_url": {"$first": "$original_url"}
-            }},
-            {"$sort": {"last_scraped": -1}}
-        ]
+        pipeline = [{"$match": {"modes": mode_name, "status": "active"}}, *_SCRAPED_SITES_PIPELINE_TAIL]
         
         sites = list(scraped_content_collection.aggregate(pipeline))
         
@@ -3154,7 +3243,7 @@ def get_scraped_sites(mode_id):
             } for site in sites]
         }
     except Exception as e:
-        print(f"Error getting scraped sites: {e}")
+        logger.exception("Error getting scraped sites: %s", e)
         return {"error": "Failed to get scraped sites", "details": str(e)}, 500
 
 
@@ -3203,7 +3292,7 @@ def delete_site_content(mode_id, domain):
         }, 202  # 202 Accepted
         
     except Exception as e:
-        print(f"Error starting site content deletion: {e}")
+        logger.exception("Error starting site content deletion: %s", e)
         return {"error": "Failed to start deletion", "details": str(e)}, 500
 
 
@@ -3217,7 +3306,7 @@ def get_blocked_pages(mode_id):
         except Exception:  # noqa: BLE001
             return {"error": "Invalid mode id"}, 400
 
-        mode_doc = modes_collection.find_one({"_id": mode_obj_id})
+        mode_doc = _get_mode_for_authz(mode_obj_id)
         if not mode_doc:
             return {"error": "Mode not found"}, 404
 
@@ -3260,7 +3349,7 @@ def get_blocked_pages(mode_id):
             "count": len(blocked_pages),
         }, 200
     except Exception as e:  # noqa: BLE001
-        print(f"Error fetching blocked pages: {e}")
+        logger.exception("Error fetching blocked pages: %s", e)
         return {"error": "Failed to fetch blocked pages", "details": str(e)}, 500
 
 
@@ -3322,6 +3411,7 @@ def block_page(mode_id):
         {"_id": mode_obj_id},
         {"$addToSet": {"blocked_page_urls": normalized_url}},
     )
+    _invalidate_mode_authz(mode_obj_id)
 
     # Store display metadata in dedicated collection
     now = datetime.utcnow()
@@ -3341,7 +3431,7 @@ def block_page(mode_id):
             upsert=True,
         )
     except Exception as e:  # noqa: BLE001
-        print(f"Failed to upsert blocked page record: {e}")
+        logger.warning("Failed to upsert blocked page record: %s", e)
 
     # IMPORTANT: Blocking is per-mode. Detach the page from THIS mode without impacting other modes.
     # Only delete the underlying scraped_content document if it is no longer used by any mode.
@@ -3371,7 +3461,7 @@ def block_page(mode_id):
                         mode_name=None,
                     )
                 except Exception as e:  # noqa: BLE001
-                    print(f"Failed to queue delete job for orphaned blocked page: {e}")
+                    logger.warning("Failed to queue delete job for orphaned blocked page: %s", e)
         elif normalized_url:
             # Best-effort detach when the UI blocks by URL (no content_id provided)
             for doc in scraped_content_collection.find(
@@ -3392,7 +3482,7 @@ def block_page(mode_id):
                 {"$pull": {"modes": mode_name}},
             )
     except Exception as e:  # noqa: BLE001
-        print(f"Failed to detach blocked page from mode: {e}")
+        logger.warning("Failed to detach blocked page from mode: %s", e)
 
     return {"status": "blocked", "normalized_url": normalized_url, "job_id": str(job_id) if job_id else None}, 200
 
@@ -3448,7 +3538,7 @@ def block_pages_bulk(mode_id):
         if not nurl:
             continue
         normalized_urls.append(nurl)
-        valid_content_ids.append(str(d["_id"]))
+        valid_content_ids.append(d["_id"])
         records.append(
             {
                 "mode_id": mode_obj_id,
@@ -3465,10 +3555,14 @@ def block_pages_bulk(mode_id):
     if not normalized_urls:
         return {"error": "No eligible pages to block"}, 400
 
+    # Several content docs can share a URL; dedupe locally (order-preserving) so Mongo
+    # doesn't repeat the set-membership scan of blocked_page_urls for each duplicate.
+    unique_urls = list(dict.fromkeys(normalized_urls))
     modes_collection.update_one(
         {"_id": mode_obj_id},
-        {"$addToSet": {"blocked_page_urls": {"$each": normalized_urls}}},
+        {"$addToSet": {"blocked_page_urls": {"$each": unique_urls}}},
     )
+    _invalidate_mode_authz(mode_obj_id)
 
     try:
         if records:
@@ -3479,9 +3573,9 @@ def block_pages_bulk(mode_id):
 
     # IMPORTANT: per-mode block. Detach each page from THIS mode; delete only if orphaned.
     job_ids = []
-    for cid in valid_content_ids:
+    for content_obj_id in valid_content_ids:
+        cid = str(content_obj_id)
         try:
-            content_obj_id = ObjectId(cid)
             doc = None
             try:
                 doc = scraped_content_collection.find_one(
@@ -3513,9 +3607,9 @@ def block_pages_bulk(mode_id):
                     )
                     job_ids.append(str(job_id))
                 except Exception as e:  # noqa: BLE001
-                    print(f"Failed to queue delete for orphaned content {cid}: {e}")
+                    logger.warning("Failed to queue delete for orphaned content %s: %s", cid, e)
         except Exception as e:  # noqa: BLE001
-            print(f"Failed to detach block for {cid}: {e}")
+            logger.warning("Failed to detach block for %s: %s", cid, e)
 
     return {"status": "blocked", "count": len(normalized_urls), "job_ids": job_ids}, 200
 
@@ -3547,6 +3641,7 @@ def unblock_page(mode_id):
         {"_id": mode_obj_id},
         {"$pull": {"blocked_page_urls": normalized_url}},
     )
+    _invalidate_mode_authz(mode_obj_id)
     blocked_pages_collection.delete_one({"mode_id": mode_obj_id, "normalized_url": normalized_url})
     # Legacy cleanup
     blocked_pages_collection.delete_one({"mode": mode_name, "user_id": mode_owner_id, "normalized_url": normalized_url})
@@ -3580,6 +3675,7 @@ def unblock_pages_bulk(mode_id):
         {"_id": mode_obj_id},
         {"$pullAll": {"blocked_page_urls": normalized_urls}},
     )
+    _invalidate_mode_authz(mode_obj_id)
     blocked_pages_collection.delete_many({"mode_id": mode_obj_id, "normalized_url": {"$in": normalized_urls}})
     # Legacy cleanup
     blocked_pages_collection.delete_many({"mode": mode_name, "user_id": mode_owner_id, "normalized_url": {"$in": normalized_urls}})
@@ -3626,7 +3722,7 @@ def get_discovered_files(mode_id):
         }, 200
         
     except Exception as e:
-        print(f"Error fetching discovered files: {e}")
+        logger.exception("Error fetching discovered files: %s", e)
         return {"error": "Failed to fetch discovered files", "details": str(e)}, 500
 
 
@@ -3655,9 +3751,14 @@ def add_discovered_file(mode_id):
         if not file_id:
             return {"error": "file_id is required"}, 400
         
+        try:
+            file_obj_id = ObjectId(file_id)
+        except Exception:  # noqa: BLE001
+            return {"error": "Invalid file id"}, 400
+
         # Get the discovered file record
         discovered_files_collection = db.get_collection("discovered_files")
-        file_doc = discovered_files_collection.find_one({"_id": ObjectId(file_id)})
+        file_doc = discovered_files_collection.find_one({"_id": file_obj_id})
         
         if not file_doc:
             return {"error": "File not found"}, 404
@@ -3677,7 +3778,7 @@ def add_discovered_file(mode_id):
         filename = file_doc.get("filename")
         
         # Download the file from URL
-        print(f"Downloading file from {file_url}...")
+        logger.info("Downloading file from %s...", file_url)
         response = requests.get(file_url, timeout=60)
         response.raise_for_status()
         file_data = response.content
@@ -3694,13 +3795,13 @@ def add_discovered_file(mode_id):
             ContentType=content_type,
             Metadata={}
         )
-        print(f"Uploaded to S3: {s3_key}")
+        logger.info("Uploaded to S3: %s", s3_key)
         
         # Upload to OpenAI
         file_stream = io.BytesIO(file_data)
         openai_file = client.files.create(file=(filename, file_stream), purpose="assistants")
         openai_file_id = openai_file.id
-        print(f"Uploaded to OpenAI: {openai_file_id}")
+        logger.info("Uploaded to OpenAI: %s", openai_file_id)
         
         # Add to vector store
         if VECTOR_STORE_ID:
@@ -3713,9 +3814,9 @@ def add_discovered_file(mode_id):
                     file_id=openai_file_id,
                     attributes=vs_meta
                 )
-                print(f"Added to vector store: {VECTOR_STORE_ID}")
+                logger.info("Added to vector store: %s", VECTOR_STORE_ID)
             except Exception as e:
-                print(f"Vector store add failed: {e}")
+                logger.warning("Vector store add failed: %s", e)
         
         # Save to MongoDB documents collection
         doc = {
@@ -3731,11 +3832,11 @@ def add_discovered_file(mode_id):
             "filename": filename
         }
         result = documents_collection.insert_one(doc)
-        print(f"Saved to MongoDB documents collection")
+        logger.info("Saved to MongoDB documents collection")
         
         # Update the discovered file status
         discovered_files_collection.update_one(
-            {"_id": ObjectId(file_id)},
+            {"_id": file_obj_id},
             {
                 "$set": {
                     "status": "added",
@@ -3759,10 +3860,10 @@ def add_discovered_file(mode_id):
         }, 200
         
     except requests.exceptions.RequestException as e:
-        print(f"Error downloading file: {e}")
+        logger.exception("Error downloading file: %s", e)
         return {"error": "Failed to download file", "details": str(e)}, 500
     except Exception as e:
-        print(f"Error adding discovered file: {e}")
+        logger.exception("Error adding discovered file: %s", e)
         return {"error": "Failed to add file", "details": str(e)}, 500
 
 
@@ -3776,29 +3877,20 @@ def block_discovered_file(mode_id):
         
         if not file_id:
             return {"error": "file_id is required"}, 400
-        
-        # Get the discovered file
-        discovered_files_collection = db.get_collection("discovered_files")
-        file_doc = discovered_files_collection.find_one({"_id": ObjectId(file_id)})
-        
-        if not file_doc:
-            return {"error": "File not found"}, 404
-        
-        file_url = file_doc.get("file_url")
-        mode_name = file_doc.get("mode")
-        if not file_url:
-            return {"error": "File URL not found"}, 400
-        if not mode_name:
-            return {"error": "File mode not found"}, 400
-        
-        # Verify mode exists + access (do NOT bake user_id into the Mongo query; it can be
+
+        try:
+            file_obj_id = ObjectId(file_id)
+        except Exception:  # noqa: BLE001
+            return {"error": "Invalid file id"}, 400
+
+        # Verify mode exists + access first (do NOT bake user_id into the Mongo query; it can be
         # stored as a non-string in older data, which causes false 403s.)
         try:
             mode_obj_id = ObjectId(mode_id)
         except Exception:  # noqa: BLE001
             return {"error": "Invalid mode id"}, 400
 
-        mode_doc = modes_collection.find_one({"_id": mode_obj_id})
+        mode_doc = _get_mode_for_authz(mode_obj_id)
         if not mode_doc:
             return {"error": "Mode not found"}, 404
 
@@ -3806,20 +3898,41 @@ def block_discovered_file(mode_id):
             owner_id = mode_doc.get("user_id")
             if not owner_id or str(owner_id) != str(request.user.get("sub")):
                 return {"error": "Access denied"}, 403
-            
-        if mode_doc.get("name") != mode_name:
+
+        mode_name = mode_doc.get("name")
+
+        # Read the URL with the mode/URL preconditions in the filter; on a miss we look the
+        # file up again to report why.
+        discovered_files_collection = db.get_collection("discovered_files")
+        file_doc = None
+        if mode_name:
+            file_doc = discovered_files_collection.find_one(
+                {"_id": file_obj_id, "mode": mode_name, "file_url": {"$nin": [None, ""]}},
+                {"file_url": 1},
+            )
+        if not file_doc:
+            existing = discovered_files_collection.find_one({"_id": file_obj_id}, {"file_url": 1, "mode": 1})
+            if not existing:
+                return {"error": "File not found"}, 404
+            if not existing.get("file_url"):
+                return {"error": "File URL not found"}, 400
+            if not existing.get("mode"):
+                return {"error": "File mode not found"}, 400
             return {"error": "File does not belong to this mode"}, 400
-            
-        # Add URL to blocked_file_urls
+
+        file_url = file_doc.get("file_url")
+
+        # Add URL to blocked_file_urls before dropping the record, so a failed update
+        # leaves the file listed and the block can be retried.
         modes_collection.update_one(
             {"_id": mode_obj_id},
             {"$addToSet": {"blocked_file_urls": file_url}}
         )
-        
+
         # Delete the discovered file record
-        discovered_files_collection.delete_one({"_id": ObjectId(file_id)})
+        discovered_files_collection.delete_one({"_id": file_obj_id})
         
-        print(f"Blocked file URL: {file_url} for mode {mode_name}")
+        logger.info("Blocked file URL: %s for mode %s", file_url, mode_name)
         
         return {
             "success": True,
@@ -3827,7 +3940,7 @@ def block_discovered_file(mode_id):
         }, 200
         
     except Exception as e:
-        print(f"Error blocking file: {e}")
+        logger.exception("Error blocking file: %s", e)
         return {"error": "Failed to block file", "details": str(e)}, 500
 
 
@@ -3843,23 +3956,25 @@ def delete_discovered_file(file_id):
         except Exception:  # noqa: BLE001
             return {"error": "Invalid file id"}, 400
 
-        file_doc = discovered_files_collection.find_one({"_id": file_obj_id})
-        
+        # Fold the ownership check into the delete filter so the common case is one round-trip
+        # (all stored user_id forms are matched; older data may store ids as non-strings).
+        delete_filter = {"_id": file_obj_id}
+        if not request.user.get("is_super_admin"):
+            delete_filter["user_id"] = {"$in": _user_id_variants(str(request.user.get("sub")))}
+        file_doc = discovered_files_collection.find_one_and_delete(
+            delete_filter,
+            projection={"mode": 1, "filename": 1},
+        )
+
         if not file_doc:
+            # Distinguish a missing file from one owned by someone else.
+            if discovered_files_collection.find_one({"_id": file_obj_id}, {"_id": 1}):
+                return {"error": "Access denied"}, 403
             return {"error": "File not found"}, 404
-        
+
         mode_name = file_doc.get("mode")
-        
-        # Verify user has access (string-safe check; older data may store ids as non-strings)
-        if not request.user.get("is_super_admin"):
-            file_owner_id = file_doc.get("user_id")
-            if not file_owner_id or str(file_owner_id) != str(request.user.get("sub")):
-                return {"error": "Access denied"}, 403
-        
-        # Delete the discovered file record
-        discovered_files_collection.delete_one({"_id": file_obj_id})
-        
-        print(f"Deleted discovered file: {file_doc.get('filename')} from mode {mode_name}")
+
+        logger.info("Deleted discovered file: %s from mode %s", file_doc.get('filename'), mode_name)
         
         return {
             "success": True,
@@ -3867,47 +3982,108 @@ def delete_discovered_file(file_id):
         }, 200
         
     except Exception as e:
-        print(f"Error deleting discovered file: {e}")
+        logger.exception("Error deleting discovered file: %s", e)
         return {"error": "Failed to delete file", "details": str(e)}, 500
 
 
+# Only the fields the list endpoints serialize; skips the (large) scraped `content` body.
+_SCRAPED_CONTENT_LIST_PROJECTION = {
+    "original_url": 1,
+    "url": 1,
+    "title": 1,
+    "status": 1,
+    "scraped_at": 1,
+    "error_message": 1,
+    "metadata.word_count": 1,
+    "modes": 1,
+    "mode": 1,
+}
+_SCRAPE_JOB_LIST_PROJECTION = {
+    "mode_id": 1,
+    "mode_name": 1,
+    "status": 1,
+    "progress": 1,
+    "error": 1,
+    "created_at": 1,
+    "started_at": 1,
+    "completed_at": 1,
+}
+_ACTIVE_SCRAPE_JOB_PROJECTION = {
+    "job_type": 1,
+    "mode_id": 1,
+    "mode_name": 1,
+    "domain": 1,
+    "status": 1,
+    "progress": 1,
+    "created_at": 1,
+    "started_at": 1,
+}
+_ACTIVE_SCRAPE_JOB_STATUSES = ["queued", "in_progress"]
+_ACTIVE_SCRAPE_JOBS_PIPELINE_TAIL = (
+    {"$sort": {"created_at": -1}},
+    {"$project": _ACTIVE_SCRAPE_JOB_PROJECTION},
+)
+
+
 @routes.get("/admin/scraped-content")
 @cognito_auth_required
 def list_scraped_content():
     """List all scraped content, optionally filtered by mode."""
     mode = request.args.get("mode", "").strip()
 
-    if request.user.get("is_super_admin"):
-        query = {}
-        if mode:
-            query["modes"] = mode  # Updated for new schema with modes array
-        content_docs = list(scraped_content_collection.find(query))
-    else:
-        pipeline = [{"$match": {"$expr": {"$eq": [{"$toString": "$user_id"}, str(request.user.get("sub"))]}}}]
-        if mode:
-            pipeline.insert(0, {"$match": {"modes": mode}})
-        content_docs = list(scraped_content_collection.aggregate(pipeline))
-    
-    scraped_content = []
-    for doc in content_docs:
-        # Get modes list (support both old and new schema)
-        modes_list = doc.get("modes", [])
-        if not modes_list and doc.get("mode"):
-            modes_list = [doc.get("mode")]
-        
-        scraped_content.append({
-            "_id": str(doc["_id"]),
-            "mode": doc.get("mode") or (modes_list[0] if modes_list else None),  # Backward compat
-            "modes": modes_list,  # New field with all modes
-            "url": doc.get("original_url") or doc.get("url"),  # Support both schemas
-            "title": doc.get("title", "Untitled"),
-            "status": doc.get("status"),
-            "scraped_at": doc.get("scraped_at").isoformat() if doc.get("scraped_at") else None,
-            "error_message": doc.get("error_message"),
-            "word_count": doc.get("metadata", {}).get("word_count", 0)
-        })
-    
-    return {"scraped_content": scraped_content}
+    query = {}
+    if not request.user.get("is_super_admin"):
+        # Match every stored user_id form directly so the (user_id, modes) index is used.
+        query["user_id"] = {"$in": _user_id_variants(str(request.user.get("sub")))}
+    if mode:
+        query["modes"] = mode  # Updated for new schema with modes array
+    # Unbounded result set: larger batches cut getMore round-trips (default first batch is 101).
+    cursor = scraped_content_collection.find(query, _SCRAPED_CONTENT_LIST_PROJECTION).batch_size(1000)
+    # Read the first batch before the 200 goes out, so a failed query still gets a normal
+    # error response instead of a truncated body.
+    first_doc = next(cursor, None)
+    first_row = json.dumps(_scraped_content_list_row(first_doc)) if first_doc else None
+
+    def generate():
+        # Stream one row at a time so memory stays flat and the first bytes go out
+        # before the whole cursor has been read.
+        yield '{"scraped_content": ['
+        if first_row is None:
+            yield "]}"
+            return
+        yield first_row
+        try:
+            for doc in cursor:
+                yield "," + json.dumps(_scraped_content_list_row(doc))
+        except Exception:  # noqa: BLE001
+            # Headers are already sent; close the document so clients can still parse it.
+            logger.exception("Scraped content listing failed mid-stream")
+            yield '], "error": "Scraped content list was truncated"}'
+            return
+        finally:
+            cursor.close()
+        yield "]}"
+
+    return Response(generate(), mimetype="application/json")
+
+
+def _scraped_content_list_row(doc):
+    # Get modes list (support both old and new schema)
+    modes_list = doc.get("modes", [])
+    if not modes_list and doc.get("mode"):
+        modes_list = [doc.get("mode")]
+
+    return {
+        "_id": str(doc["_id"]),
+        "mode": doc.get("mode") or (modes_list[0] if modes_list else None),  # Backward compat
+        "modes": modes_list,  # New field with all modes
+        "url": doc.get("original_url") or doc.get("url"),  # Support both schemas
+        "title": doc.get("title", "Untitled"),
+        "status": doc.get("status"),
+        "scraped_at": doc.get("scraped_at").isoformat() if doc.get("scraped_at") else None,
+        "error_message": doc.get("error_message"),
+        "word_count": doc.get("metadata", {}).get("word_count", 0)
+    }
 
 
 @routes.delete("/admin/scraped-content/<content_id>")
@@ -3919,12 +4095,15 @@ def delete_scraped_content(content_id):
     except Exception:  # noqa: BLE001
         return {"error": "Invalid content id"}, 400
 
-    doc = scraped_content_collection.find_one({"_id": content_obj_id})
-    if not doc:
-        return {"error": "Content not found"}, 404
+    # Owner-scoped existence check (no content body transferred); on a miss, look again
+    # without the owner filter to tell 404 from 403.
+    owner_filter = {"_id": content_obj_id}
     if not request.user.get("is_super_admin"):
-        if not doc.get("user_id") or str(doc.get("user_id")) != str(request.user.get("sub")):
+        owner_filter["user_id"] = {"$in": _user_id_variants(str(request.user.get("sub")))}
+    if not scraped_content_collection.find_one(owner_filter, {"_id": 1}):
+        if scraped_content_collection.find_one({"_id": content_obj_id}, {"_id": 1}):
             return {"error": "Access denied"}, 403
+        return {"error": "Content not found"}, 404
     
     job_id = scraper_client.queue_delete_content(
         content_id=content_id,
@@ -3953,11 +4132,12 @@ def refresh_scraped_content(content_id):
     except Exception:  # noqa: BLE001
         return {"error": "Invalid content id"}, 400
 
+    sub = str(request.user.get("sub"))
     doc = scraped_content_collection.find_one({"_id": content_obj_id})
     if not doc:
         return {"error": "Content not found"}, 404
     if not request.user.get("is_super_admin"):
-        if not doc.get("user_id") or str(doc.get("user_id")) != str(request.user.get("sub")):
+        if not doc.get("user_id") or str(doc.get("user_id")) != sub:
             return {"error": "Access denied"}, 403
     
     # Support both old and new schema
@@ -3973,115 +4153,45 @@ def refresh_scraped_content(content_id):
     # Block check: prevent refresh if URL is blocked for this mode
     mode_doc_for_owner = None
     try:
-        for candidate in modes_collection.find({"name": mode}, {"blocked_page_urls": 1, "user_id": 1}):
-            if str(candidate.get("user_id")) == str(user_id):
-                mode_doc_for_owner = candidate
-                break
+        mode_doc_for_owner = modes_collection.find_one(
+            {"name": mode, "user_id": {"$in": _user_id_variants(user_id)}},
+            {"blocked_page_urls": 1, "user_id": 1},
+        )
         if mode_doc_for_owner and normalized_url and normalized_url in (mode_doc_for_owner.get("blocked_page_urls") or []):
             return {"error": "This page URL is blocked for this mode"}, 400
     except Exception as e:  # noqa: BLE001
-        print(f"Blocked-page check failed: {e}")
+        logger.warning("Blocked-page check failed: %s", e)
     
-    if SCRAPER_EXECUTION_MODE != "local" or scraping_service is None:
-        job_id = scraper_client.queue_single_url_refresh(
-            content_id=content_id,
-            url=url,
-            mode_name=mode,
-            user_id=user_id,
-        )
-
-        # Update mode "last scrape" timestamp when a refresh is initiated/queued
-        try:
-            if mode_doc_for_owner and mode_doc_for_owner.get("_id"):
-                modes_collection.update_one(
-                    {"_id": mode_doc_for_owner["_id"]},
-                    {"$set": {"last_scraped_at": datetime.utcnow()}},
-                )
-        except Exception as e:  # noqa: BLE001
-            print(f"Error updating last_scraped_at for mode refresh: {e}")
+    # Always run the refresh as a job: the local backend executes it on a background thread,
+    # so the request never blocks on the scrape + vector-store upload.
+    job_id = scraper_client.queue_single_url_refresh(
+        content_id=content_id,
+        url=url,
+        mode_name=mode,
+        user_id=user_id,
+    )
 
-        return {
-            "status": "queued",
-            "job_id": str(job_id),
-            "mode": mode,
-            "message": "Refresh job enqueued on scraper worker"
-        }, 202
-    
+    # Update mode "last scrape" timestamp when a refresh is initiated/queued
     try:
-        # Scrape the URL locally
-        content, title, error = scraping_service.scrape_url(url)
-        
-        if error:
-            # Update with error
-            scraped_content_collection.update_one(
-                {"_id": ObjectId(content_id)},
-                {
-                    "$set": {
-                        "status": "failed",
-                        "error_message": error,
-                        "scraped_at": datetime.utcnow()
-                    }
-                }
+        if mode_doc_for_owner and mode_doc_for_owner.get("_id"):
+            modes_collection.update_one(
+                {"_id": mode_doc_for_owner["_id"]},
+                {"$set": {"last_scraped_at": datetime.utcnow()}},
             )
-            return {"error": error}, 400
-        
-        # Upload to vector store
-        scraped_at = datetime.utcnow()
-        
-        # Delete old file if exists
-        old_file_id = doc.get("openai_file_id")
-        if old_file_id and VECTOR_STORE_ID:
-            try:
-                client.files.delete(old_file_id)
-                client.vector_stores.files.delete(
-                    vector_store_id=VECTOR_STORE_ID,
-                    file_id=old_file_id
-                )
-            except Exception as e:
-                print(f"Error deleting old file: {e}")
-        
-        openai_file_id = scraping_service.upload_to_vector_store(
-            content, mode, url, title, scraped_at
-        )
+    except Exception as e:  # noqa: BLE001
+        logger.exception("Error updating last_scraped_at for mode refresh: %s", e)
 
-        # Update mode "last scrape" timestamp after a successful refresh run
-        try:
-            if mode_doc_for_owner and mode_doc_for_owner.get("_id"):
-                modes_collection.update_one(
-                    {"_id": mode_doc_for_owner["_id"]},
-                    {"$set": {"last_scraped_at": scraped_at}},
-                )
-        except Exception as e:  # noqa: BLE001
-            print(f"Error updating last_scraped_at after local refresh: {e}")
-        
-        # Update document
-        scraped_content_collection.update_one(
-            {"_id": ObjectId(content_id)},
-            {
-                "$set": {
-                    "title": title,
-                    "content": content,
-                    "scraped_at": scraped_at,
-                    "openai_file_id": openai_file_id,
-                    "status": "active",
-                    "error_message": None,
-                    "metadata": {
-                        "word_count": len(content.split()),
-                        "char_count": len(content)
-                    }
-                }
-            }
-        )
-        
-        return {
-            "status": "success",
-            "title": title,
-            "word_count": len(content.split())
-        }, 200
-        
-    except Exception as e:
-        print(f"Error refreshing content: {e}")
-        return {"error": "Failed to refresh content", "details": str(e)}, 500
+    if not scraper_client.is_remote and SCRAPER_EXECUTION_MODE == "local":
+        message = "Refresh running on local scraper service"
+    else:
+        message = "Refresh job enqueued on scraper worker"
+
+    return {
+        "status": "queued",
+        "job_id": str(job_id),
+        "mode": mode,
+        "message": message,
+    }, 202
 
 
 @routes.get("/admin/scrape/job/<job_id>")
@@ -4094,7 +4204,10 @@ def get_scrape_job_status(job_id):
         except Exception:  # noqa: BLE001
             return {"error": "Invalid job id"}, 400
 
-        job = scraping_jobs_collection.find_one({"_id": job_obj_id})
+        job = scraping_jobs_collection.find_one(
+            {"_id": job_obj_id},
+            {**_SCRAPE_JOB_LIST_PROJECTION, "result": 1, "user_id": 1},
+        )
         if not job:
             return {"error": "Job not found"}, 404
         if not request.user.get("is_super_admin"):
@@ -4114,7 +4227,7 @@ def get_scrape_job_status(job_id):
             "completed_at": job["completed_at"].isoformat() if job.get("completed_at") else None
         }
     except Exception as e:
-        print(f"Error getting job status: {e}")
+        logger.exception("Error getting job status: %s", e)
         return {"error": "Failed to get job status", "details": str(e)}, 500
 
 
@@ -4125,17 +4238,17 @@ def list_scrape_jobs():
     try:
         mode_name = request.args.get("mode", "").strip()
 
-        if request.user.get("is_super_admin"):
-            query = {}
-            if mode_name:
-                query["mode_name"] = mode_name
-            jobs = list(scraping_jobs_collection.find(query).sort("created_at", -1).limit(50))
-        else:
-            pipeline = [{"$match": {"$expr": {"$eq": [{"$toString": "$user_id"}, str(request.user.get("sub"))]}}}]
-            if mode_name:
-                pipeline.insert(0, {"$match": {"mode_name": mode_name}})
-            pipeline.extend([{"$sort": {"created_at": -1}}, {"$limit": 50}])
-            jobs = list(scraping_jobs_collection.aggregate(pipeline))
+        query = {}
+        if not request.user.get("is_super_admin"):
+            # Direct match on user_id so (user_id[, mode_name], created_at) indexes bound the scan.
+            query["user_id"] = {"$in": _user_id_variants(str(request.user.get("sub")))}
+        if mode_name:
+            query["mode_name"] = mode_name
+        jobs = list(
+            scraping_jobs_collection.find(query, _SCRAPE_JOB_LIST_PROJECTION)
+            .sort("created_at", -1)
+            .limit(50)
+        )
         
         return {
             "jobs": [{
@@ -4151,7 +4264,7 @@ def list_scrape_jobs():
             } for job in jobs]
         }
     except Exception as e:
-        print(f"Error listing jobs: {e}")
+        logger.exception("Error listing jobs: %s", e)
         return {"error": "Failed to list jobs", "details": str(e)}, 500
 
 
@@ -4166,21 +4279,31 @@ def get_active_scrape_jobs(mode_id):
         except Exception:  # noqa: BLE001
             return {"error": "Invalid mode id"}, 400
 
-        mode = modes_collection.find_one({"_id": mode_obj_id})
+        # Fetch the mode owner and its active jobs in one round-trip: the jobs are joined
+        # onto the mode doc, and served by the (mode_id, status, created_at) index.
+        pipeline = [
+            {"$match": {"_id": mode_obj_id}},
+            {"$project": {"user_id": 1}},
+            {
+                "$lookup": {
+                    "from": scraping_jobs_collection.name,
+                    "pipeline": [
+                        {"$match": {"mode_id": mode_id, "status": {"$in": _ACTIVE_SCRAPE_JOB_STATUSES}}},
+                        *_ACTIVE_SCRAPE_JOBS_PIPELINE_TAIL,
+                    ],
+                    "as": "jobs",
+                }
+            },
+        ]
+        mode = next(modes_collection.aggregate(pipeline), None)
         if not mode:
             return {"error": "Mode not found"}, 404
         if not request.user.get("is_super_admin"):
             if not mode.get("user_id") or str(mode.get("user_id")) != str(request.user.get("sub")):
                 return {"error": "Access denied"}, 403
-        
-        # Find all active jobs for this mode
-        query = {
-            "mode_id": mode_id,
-            "status": {"$in": ["queued", "in_progress"]}
-        }
-        
-        jobs = list(scraping_jobs_collection.find(query).sort("created_at", -1))
-        
+
+        jobs = mode.get("jobs") or []
+
         return {
             "jobs": [{
                 "_id": str(job["_id"]),
@@ -4195,7 +4318,7 @@ def get_active_scrape_jobs(mode_id):
             } for job in jobs]
         }
     except Exception as e:
-        print(f"Error getting active jobs: {e}")
+        logger.exception("Error getting active jobs: %s", e)
         return {"error": "Failed to get active jobs", "details": str(e)}, 500
 
 
@@ -4209,21 +4332,20 @@ def delete_scrape_job(job_id):
         except Exception:  # noqa: BLE001
             return {"error": "Invalid job id"}, 400
 
-        job = scraping_jobs_collection.find_one({"_id": job_obj_id})
-        if not job:
-            return {"error": "Job not found"}, 404
+        # Ownership is part of the delete filter, so the common case is a single round-trip.
+        delete_filter = {"_id": job_obj_id}
         if not request.user.get("is_super_admin"):
-            if not job.get("user_id") or str(job.get("user_id")) != str(request.user.get("sub")):
-                return {"error": "Access denied"}, 403
+            delete_filter["user_id"] = {"$in": _user_id_variants(str(request.user.get("sub")))}
+        result = scraping_jobs_collection.delete_one(delete_filter)
 
-        result = scraping_jobs_collection.delete_one({"_id": job_obj_id})
-        
         if result.deleted_count == 0:
+            if scraping_jobs_collection.find_one({"_id": job_obj_id}, {"_id": 1}):
+                return {"error": "Access denied"}, 403
             return {"error": "Job not found"}, 404
         
         return {"status": "deleted"}, 200
     except Exception as e:
-        print(f"Error deleting job: {e}")
+        logger.exception("Error deleting job: %s", e)
         return {"error": "Failed to delete job", "details": str(e)}, 500
 
 
@@ -4242,7 +4364,7 @@ if __name__ == "__main__":
     scrape_scheduler.start()
     
     port = int(os.getenv("PORT", "3000"))
-    print(f"Starting server on port {port}")
+    logger.info("Starting server on port %s", port)
     
     try:
         app.run(port=port)
@@ -1,6 +1,7 @@
 """Service adapters used by the Flask application."""
 
+from .mongo import get_mongo_client
 from .scraper_client import ScraperClient, ScraperClientMode
+from .sqs import build_sqs_client
 
-__all__ = ["ScraperClient", "ScraperClientMode"]
-
+__all__ = ["ScraperClient", "ScraperClientMode", "build_sqs_client", "get_mongo_client"]
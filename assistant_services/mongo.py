@@ -0,0 +1,37 @@
+from __future__ import annotations
+
+from functools import lru_cache
+
+from decouple import config
+from pymongo import MongoClient
+from pymongo.server_api import ServerApi
+
+
+@lru_cache(maxsize=1)
+def get_mongo_client() -> MongoClient:
+    """
+    Return the process-wide MongoClient.
+
+    Every collection handle should be derived from this client so a process owns a
+    single connection pool (and a single set of server monitors). The pool is kept
+    warm via minPoolSize, and the wait-queue/socket timeouts bound tail latency
+    when it is exhausted. MONGO_COMPRESSORS (e.g. "zstd,zlib") opts into wire
+    compression; pymongo skips any compressor whose library is not installed.
+    """
+    options = {}
+    compressors = config("MONGO_COMPRESSORS", default="").strip()
+    if compressors:
+        options["compressors"] = compressors
+    return MongoClient(
+        config("MONGO_URI"),
+        server_api=ServerApi("1"),
+        maxPoolSize=int(config("MONGO_MAX_POOL_SIZE", default="50")),
+        minPoolSize=int(config("MONGO_MIN_POOL_SIZE", default="10")),
+        maxIdleTimeMS=60000,
+        waitQueueTimeoutMS=5000,
+        connectTimeoutMS=3000,
+        serverSelectionTimeoutMS=3000,
+        socketTimeoutMS=int(config("MONGO_SOCKET_TIMEOUT_MS", default="10000")),
+        retryWrites=True,
+        **options,
+    )
@@ -1,14 +1,42 @@
 from __future__ import annotations
 
+import atexit
+import hashlib
+import logging
+import os
+import queue
 import threading
-from datetime import datetime
+import time
+from concurrent.futures import Future
+from contextlib import contextmanager
+from datetime import datetime, timedelta
 from enum import Enum
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 from uuid import uuid4
 
+from bson import ObjectId
+from decouple import config
+from pymongo.errors import BulkWriteError
+
 from packages.common.scraper_contracts import ScraperJobRequest, ScraperQueueConfig
 from scraper_jobs import ScrapeJobProcessor
 
+logger = logging.getLogger(__name__)
+
+# SendMessageBatch accepts at most 10 entries and 256 KiB of message data per call.
+SQS_MAX_BATCH_SIZE = 10
+SQS_MAX_BATCH_BYTES = 256 * 1024
+SQS_BATCH_RETRIES = 2
+# Statuses that mean a job has not finished yet; used to skip duplicate enqueues.
+ACTIVE_JOB_STATUSES = ("queued", "in_progress")
+# Payload fields identifying the same unit of work; repeats within one SQS batch are dropped.
+BATCH_DEDUP_KEY_FIELDS = {
+    "scrape": ("mode_id",),
+    "single_url_refresh": ("content_id",),
+    "delete_content": ("content_id",),
+    "site_delete": ("mode_name", "domain"),
+}
+
 
 class ScraperClientMode(str, Enum):
     LOCAL = "local"
@@ -16,7 +44,12 @@ class ScraperClientMode(str, Enum):
 
 
 class ScraperClient:
-    """Dispatch scraping work either locally or through an SQS-backed worker."""
+    """
+    Dispatch scraping work either locally or through an SQS-backed worker.
+
+    In remote mode, pass an SQS client built with `build_sqs_client` so its HTTP pool
+    is sized for concurrent and batched dispatch.
+    """
 
     def __init__(
         self,
@@ -31,36 +64,68 @@ class ScraperClient:
         self.mode = ScraperClientMode(mode.lower())
         self.jobs_collection = jobs_collection
         self.environment = scraper_environment
+        # Unfinished jobs untouched for this long are treated as abandoned (failed dispatch, dead
+        # worker) so they stop blocking new jobs for the same work.
+        self.active_job_stale_after = timedelta(
+            minutes=int(config("SCRAPER_ACTIVE_JOB_STALE_MINUTES", default="60"))
+        )
 
         if self.mode == ScraperClientMode.LOCAL:
             if scraping_service is None:
                 raise ValueError("scraping_service is required for local mode")
             processor = ScrapeJobProcessor(scraping_service, jobs_collection, environment=scraper_environment)
-            self._backend = _LocalScraperBackend(processor)
+            self._backend = _LocalScraperBackend(processor, on_failed=self._mark_job_failed)
         else:
             if sqs_client is None or queue_config is None:
                 raise ValueError("SQS client and queue config are required for remote mode")
-            self._backend = _SQSScraperBackend(sqs_client, queue_config)
+            self._backend = _SQSScraperBackend(
+                sqs_client,
+                queue_config,
+                on_deduped=self._mark_job_deduped,
+                on_failed=self._mark_job_failed,
+            )
 
     # ------------------------------------------------------------------ #
     # Job creation helpers
     # ------------------------------------------------------------------ #
-    def queue_mode_scrape(
+    def find_active_job(self, job_type: str, **identity: Any):
+        """Return the `_id` of a live unfinished job of this type and identity, if one exists."""
+        existing = self.jobs_collection.find_one({**self._active_job_filter(job_type), **identity}, {"_id": 1})
+        return existing["_id"] if existing else None
+
+    def _active_job_filter(self, job_type: str) -> Dict[str, Any]:
+        cutoff = datetime.utcnow() - self.active_job_stale_after
+        return {
+            "job_type": job_type,
+            "environment": self.environment,
+            "status": {"$in": list(ACTIVE_JOB_STATUSES)},
+            # Audited writes stamp updated_at on every progress update, so it doubles as a heartbeat.
+            "$or": [{"updated_at": {"$gte": cutoff}}, {"created_at": {"$gte": cutoff}}],
+        }
+
+    def _dispatch_new_job(self, dispatch, job_id, *args: Any, **kwargs: Any):
+        """Dispatch a just-inserted job, failing it if dispatch raises so it does not block dedupe."""
+        try:
+            return dispatch(job_id, *args, **kwargs)
+        except Exception as exc:
+            self._mark_job_failed(str(job_id), f"Dispatch failed: {exc}")
+            raise
+
+    def _build_mode_scrape_job(
         self,
         *,
         mode_name: str,
         user_id: str,
         mode_id: str,
         scrape_sites: List[str],
-        resume_state: Optional[Dict[str, Any]] = None,
-        auto_dispatch: bool = True,
-    ):
-        """Create or resume a scraping job for a mode."""
+        resume_state: Optional[Dict[str, Any]],
+        now: datetime,
+    ) -> Dict[str, Any]:
         normalized_sites = [site.strip() for site in (scrape_sites or []) if site and site.strip()]
         if not normalized_sites:
             raise ValueError("No valid sites provided for scraping")
 
-        job_doc = {
+        return {
             "job_type": "scrape",
             "mode_id": str(mode_id),
             "mode_name": mode_name,
@@ -74,28 +139,143 @@ class ScraperClient:
                 "reused_pages": 0,
                 "failed_pages": 0,
             },
-            "checkpoint": {
+            "checkpoint": resume_state or {
                 "pending_sites": normalized_sites,
             },
             "result": None,
             "error": None,
-            "created_at": datetime.utcnow(),
+            "created_at": now,
             "started_at": None,
             "completed_at": None,
             "environment": self.environment,
         }
 
-        if resume_state:
-            job_doc["checkpoint"] = resume_state
+    def queue_mode_scrape(
+        self,
+        *,
+        mode_name: str,
+        user_id: str,
+        mode_id: str,
+        scrape_sites: List[str],
+        resume_state: Optional[Dict[str, Any]] = None,
+        auto_dispatch: bool = True,
+        now: Optional[datetime] = None,
+        dedupe: bool = True,
+    ):
+        """Create or resume a scraping job for a mode (returns the active job if one exists)."""
+        job_doc = self._build_mode_scrape_job(
+            mode_name=mode_name,
+            user_id=user_id,
+            mode_id=mode_id,
+            scrape_sites=scrape_sites,
+            resume_state=resume_state,
+            now=now or datetime.utcnow(),
+        )
+        if dedupe:
+            existing_id = self.find_active_job("scrape", mode_id=str(mode_id))
+            if existing_id:
+                return existing_id
 
         job_id = self.jobs_collection.insert_one(job_doc).inserted_id
         if auto_dispatch or self.is_remote:
-            self.dispatch_mode_scrape(job_id, mode_name, user_id, resume_state, mode_id=mode_id)
+            self._dispatch_new_job(self.dispatch_mode_scrape, job_id, mode_name, user_id, resume_state, mode_id=mode_id)
         return job_id
 
+    def queue_many_mode_scrapes(
+        self,
+        requests: List[Dict[str, Any]],
+        *,
+        auto_dispatch: bool = True,
+        now: Optional[datetime] = None,
+        dedupe: bool = True,
+    ) -> List[Any]:
+        """
+        Create scrape jobs for several modes with one insert and batched dispatch.
+
+        Each request holds the `queue_mode_scrape` keyword arguments (mode_name, user_id,
+        mode_id, scrape_sites, optional resume_state). Returns new job ids in request
+        order, with None for modes that already have an active job, repeat an earlier
+        request in the same call, or could not be built or inserted (logged and skipped).
+        """
+        if not requests:
+            return []
+
+        now = now or datetime.utcnow()
+        job_docs: List[Optional[Dict[str, Any]]] = []
+        for request in requests:
+            # One bad mode must not stop the others from being queued.
+            try:
+                job_docs.append(
+                    self._build_mode_scrape_job(
+                        mode_name=request["mode_name"],
+                        user_id=request["user_id"],
+                        mode_id=request["mode_id"],
+                        scrape_sites=request.get("scrape_sites"),
+                        resume_state=request.get("resume_state"),
+                        now=now,
+                    )
+                )
+            except Exception as exc:  # noqa: BLE001
+                logger.warning("Skipping scrape job for mode %r: %s", request.get("mode_name"), exc)
+                job_docs.append(None)
+
+        seen = set()
+        if dedupe:
+            active = self.jobs_collection.find(
+                {
+                    **self._active_job_filter("scrape"),
+                    "mode_id": {"$in": [doc["mode_id"] for doc in job_docs if doc]},
+                },
+                {"_id": 1, "mode_id": 1},
+            )
+            seen.update(doc["mode_id"] for doc in active)
+
+        job_ids: List[Any] = [None] * len(job_docs)
+        pending: List[int] = []
+        for index, doc in enumerate(job_docs):
+            if doc is None or doc["mode_id"] in seen:
+                continue
+            seen.add(doc["mode_id"])
+            pending.append(index)
+
+        if not pending:
+            return job_ids
+
+        # Ids are assigned up front so a partial failure still tells us which jobs landed.
+        for index in pending:
+            job_docs[index].setdefault("_id", ObjectId())
+        failed_positions = set()
+        try:
+            self.jobs_collection.insert_many([job_docs[index] for index in pending], ordered=False)
+        except BulkWriteError as exc:
+            for error in exc.details.get("writeErrors") or []:
+                failed_positions.add(error["index"])
+                logger.warning(
+                    "Failed to insert scrape job for mode %r: %s",
+                    job_docs[pending[error["index"]]]["mode_name"],
+                    error.get("errmsg"),
+                )
+        pending = [index for position, index in enumerate(pending) if position not in failed_positions]
+        for index in pending:
+            job_ids[index] = job_docs[index]["_id"]
+
+        if pending and (auto_dispatch or self.is_remote):
+            with self.batch():
+                for index in pending:
+                    doc = job_docs[index]
+                    self._dispatch_new_job(
+                        self.dispatch_mode_scrape,
+                        job_ids[index],
+                        doc["mode_name"],
+                        doc["user_id"],
+                        requests[index].get("resume_state"),
+                        mode_id=doc["mode_id"],
+                    )
+        return job_ids
+
     def dispatch_mode_scrape(self, job_id, mode_name, user_id, resume_state=None, *, mode_id: Optional[str] = None):
         """Send a scrape job to the configured backend."""
-        self._backend.dispatch_mode_scrape(str(job_id), mode_name, user_id, resume_state, mode_id=mode_id)
+        return self._backend.dispatch_mode_scrape(str(job_id), mode_name, user_id, resume_state, mode_id=mode_id)
 
     def resume_mode_scrape(self, job_doc: Dict[str, Any]):
         """Re-dispatch an in-progress job."""
@@ -115,7 +295,11 @@ class ScraperClient:
         mode_name: str,
         user_id: str,
         auto_dispatch: bool = True,
+        now: Optional[datetime] = None,
     ):
+        existing_id = self.find_active_job("single_url_refresh", content_id=content_id)
+        if existing_id:
+            return existing_id
         job_doc = {
             "job_type": "single_url_refresh",
             "status": "queued",
@@ -124,18 +308,18 @@ class ScraperClient:
             "user_id": user_id,
             "result": None,
             "error": None,
-            "created_at": datetime.utcnow(),
+            "created_at": now or datetime.utcnow(),
             "started_at": None,
             "completed_at": None,
             "environment": self.environment,
         }
         job_id = self.jobs_collection.insert_one(job_doc).inserted_id
         if auto_dispatch or self.is_remote:
-            self.dispatch_single_url_refresh(job_id, content_id, url, mode_name, user_id)
+            self._dispatch_new_job(self.dispatch_single_url_refresh, job_id, content_id, url, mode_name, user_id)
         return job_id
 
     def dispatch_single_url_refresh(self, job_id, content_id, url, mode_name, user_id):
-        self._backend.dispatch_single_url_refresh(str(job_id), content_id, url, mode_name, user_id)
+        return self._backend.dispatch_single_url_refresh(str(job_id), content_id, url, mode_name, user_id)
 
     def queue_delete_content(
         self,
@@ -144,7 +328,11 @@ class ScraperClient:
         user_id: str,
         mode_name: Optional[str] = None,
         auto_dispatch: bool = True,
+        now: Optional[datetime] = None,
     ):
+        existing_id = self.find_active_job("delete_content", content_id=content_id)
+        if existing_id:
+            return existing_id
         job_doc = {
             "job_type": "delete_content",
             "status": "queued",
@@ -153,28 +341,39 @@ class ScraperClient:
             "user_id": user_id,
             "result": None,
             "error": None,
-            "created_at": datetime.utcnow(),
+            "created_at": now or datetime.utcnow(),
             "started_at": None,
             "completed_at": None,
             "environment": self.environment,
         }
         job_id = self.jobs_collection.insert_one(job_doc).inserted_id
         if auto_dispatch or self.is_remote:
-            self.dispatch_delete_content(job_id, content_id, mode_name)
+            self._dispatch_new_job(self.dispatch_delete_content, job_id, content_id, mode_name)
         return job_id
 
     def dispatch_delete_content(self, job_id, content_id, mode_name):
-        self._backend.dispatch_delete_content(str(job_id), content_id, mode_name)
+        return self._backend.dispatch_delete_content(str(job_id), content_id, mode_name)
 
     def queue_verification(
         self,
         *,
         batch_size: int = 500,
         auto_dispatch: bool = True,
+        now: Optional[datetime] = None,
         filters: Optional[Dict[str, Any]] = None,
         mode_name: Optional[str] = None,
         base_domain: Optional[str] = None,
+        dedupe: bool = True,
     ):
+        if dedupe:
+            existing_id = self.find_active_job(
+                "verification",
+                filters=filters or None,
+                mode=mode_name,
+                base_domain=base_domain,
+            )
+            if existing_id:
+                return existing_id
         job_doc = {
             "job_type": "verification",
             "status": "queued",
@@ -187,7 +386,7 @@ class ScraperClient:
             },
             "result": None,
             "error": None,
-            "created_at": datetime.utcnow(),
+            "created_at": now or datetime.utcnow(),
             "started_at": None,
             "completed_at": None,
             "environment": self.environment,
@@ -197,11 +396,11 @@ class ScraperClient:
         }
         job_id = self.jobs_collection.insert_one(job_doc).inserted_id
         if auto_dispatch or self.is_remote:
-            self.dispatch_verification(job_id, batch_size, filters)
+            self._dispatch_new_job(self.dispatch_verification, job_id, batch_size, filters)
         return job_id
 
     def dispatch_verification(self, job_id, batch_size: int, filters: Optional[Dict[str, Any]] = None):
-        self._backend.dispatch_verification(str(job_id), batch_size, filters)
+        return self._backend.dispatch_verification(str(job_id), batch_size, filters)
 
     def queue_site_delete(
         self,
@@ -211,7 +410,11 @@ class ScraperClient:
         domain: str,
         user_id: str,
         auto_dispatch: bool = True,
+        now: Optional[datetime] = None,
     ):
+        existing_id = self.find_active_job("site_delete", mode_id=str(mode_id), domain=domain)
+        if existing_id:
+            return existing_id
         job_doc = {
             "job_type": "site_delete",
             "status": "queued",
@@ -221,18 +424,18 @@ class ScraperClient:
             "user_id": user_id,
             "result": None,
             "error": None,
-            "created_at": datetime.utcnow(),
+            "created_at": now or datetime.utcnow(),
             "started_at": None,
             "completed_at": None,
             "environment": self.environment,
         }
         job_id = self.jobs_collection.insert_one(job_doc).inserted_id
         if auto_dispatch or self.is_remote:
-            self.dispatch_site_delete(job_id, mode_name, domain)
+            self._dispatch_new_job(self.dispatch_site_delete, job_id, mode_name, domain)
         return job_id
 
     def dispatch_site_delete(self, job_id, mode_name, domain):
-        self._backend.dispatch_site_delete(str(job_id), mode_name, domain)
+        return self._backend.dispatch_site_delete(str(job_id), mode_name, domain)
 
     def queue_api_target_scrape(
         self,
@@ -243,37 +446,37 @@ class ScraperClient:
         options: Optional[Dict[str, Any]] = None,
         timeout_ms: int = 30000,
         auto_dispatch: bool = True,
+        now: Optional[datetime] = None,
     ):
         """Create an API target scraping job and optionally dispatch it."""
-        url = (url or "").strip()
-        if not url:
-            raise ValueError("url is required")
-        if not isinstance(target, dict) or not (target.get("type") or "").strip():
-            raise ValueError("target.type is required")
-        selectors = target.get("selectors")
-        if selectors is None or not isinstance(selectors, dict):
-            raise ValueError("target.selectors must be an object")
-        if options is not None and not isinstance(options, dict):
-            raise ValueError("options must be an object")
+        url, target, options, timeout_ms = _normalize_api_target_request(url, target, options, timeout_ms)
 
         job_doc = {
             "job_type": "api_target_scrape",
             "status": "queued",
             "user_id": user_id,
             "url": url,
-            "options": options or None,
+            "options": options,
             "target": target,
-            "timeout_ms": int(timeout_ms or 30000),
+            "timeout_ms": timeout_ms,
             "result": None,
             "error": None,
-            "created_at": datetime.utcnow(),
+            "created_at": now or datetime.utcnow(),
             "started_at": None,
             "completed_at": None,
             "environment": self.environment,
         }
         job_id = self.jobs_collection.insert_one(job_doc).inserted_id
         if auto_dispatch or self.is_remote:
-            self.dispatch_api_target_scrape(job_id, url, target, user_id=user_id, options=options, timeout_ms=timeout_ms)
+            self._dispatch_new_job(
+                self.dispatch_api_target_scrape,
+                job_id,
+                url,
+                target,
+                user_id=user_id,
+                options=options,
+                timeout_ms=timeout_ms,
+            )
         return job_id
 
     def dispatch_api_target_scrape(
@@ -287,7 +490,7 @@ class ScraperClient:
         timeout_ms: int = 30000,
     ):
         """Send an api_target_scrape job to the configured backend."""
-        self._backend.dispatch_api_target_scrape(
+        return self._backend.dispatch_api_target_scrape(
             str(job_id),
             url,
             target,
@@ -296,6 +499,45 @@ class ScraperClient:
             timeout_ms=int(timeout_ms or 30000),
         )
 
+    # ------------------------------------------------------------------ #
+    # Batching
+    # ------------------------------------------------------------------ #
+    @contextmanager
+    def batch(self):
+        """Buffer remote dispatches made inside the block and send them in batches."""
+        self._backend.begin_batch()
+        try:
+            yield self
+        finally:
+            self._backend.end_batch()
+
+    def flush(self):
+        """Send any dispatches still buffered by the backend."""
+        self._backend.flush()
+
+    def _mark_job_deduped(self, job_id: str, kept_job_id: str):
+        try:
+            self.jobs_collection.update_one(
+                {"_id": ObjectId(job_id)},
+                {"$set": {"status": "deduped", "deduped_into": kept_job_id, "completed_at": datetime.utcnow()}},
+            )
+        except Exception as exc:  # noqa: BLE001
+            logger.warning("Failed to mark job %s as deduped: %s", job_id, exc)
+
+    def _mark_job_failed(self, job_id: str, error: str):
+        # Only unfinished jobs: a worker may already have picked the job up and finished it.
+        try:
+            self.jobs_collection.update_one(
+                {"_id": ObjectId(job_id), "status": {"$in": list(ACTIVE_JOB_STATUSES)}},
+                {"$set": {"status": "failed", "error": error, "completed_at": datetime.utcnow()}},
+            )
+        except Exception as exc:  # noqa: BLE001
+            logger.warning("Failed to mark job %s as failed: %s", job_id, exc)
+
+    def close(self):
+        """Stop background dispatch machinery owned by the backend."""
+        self._backend.close()
+
     # ------------------------------------------------------------------ #
     def get_verification_statistics(self) -> Dict[str, Any]:
         """Expose verification stats for schedulers."""
@@ -318,55 +560,121 @@ class ScraperClient:
 # Local backend
 # ---------------------------------------------------------------------- #
 class _LocalScraperBackend:
-    def __init__(self, job_processor: ScrapeJobProcessor):
+    """
+    Run jobs on a bounded set of daemon worker threads.
+
+    Not a ThreadPoolExecutor: its workers are joined before atexit handlers run, so a
+    shutdown would wait for the whole backlog. Daemon workers let the process exit; `close()`
+    fails jobs that never started, and running ones that cannot be resumed on restart.
+    """
+
+    def __init__(self, job_processor: ScrapeJobProcessor, *, on_failed=None):
         self.job_processor = job_processor
         self.scraping_service = job_processor.scraping_service
+        self._on_failed = on_failed
+        default_workers = max(4, (os.cpu_count() or 1) * 2)
+        self._max_workers = int(config("SCRAPER_LOCAL_MAX_WORKERS", default=str(default_workers)))
+        self._queue: "queue.SimpleQueue[Optional[Tuple[Future, str, bool, Any, tuple, dict]]]" = queue.SimpleQueue()
+        self._workers: List[threading.Thread] = []
+        # job_id -> whether the scheduler resumes it on restart (scrape jobs keep a checkpoint)
+        self._running: Dict[str, bool] = {}
+        self._lock = threading.Lock()
+        self._closed = False
+
+    # Local dispatches start immediately; there is nothing to buffer.
+    def begin_batch(self):
+        pass
+
+    def end_batch(self):
+        pass
+
+    def flush(self):
+        pass
+
+    def close(self):
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            running = dict(self._running)
+        while True:
+            try:
+                item = self._queue.get_nowait()
+            except queue.Empty:
+                break
+            if item is not None and item[0].cancel():
+                self._fail(item[1], "Scraper shut down before the job started")
+        for job_id, resumable in running.items():
+            if not resumable:
+                self._fail(job_id, "Scraper shut down while the job was running")
+        for _ in self._workers:
+            self._queue.put(None)
+
+    def _fail(self, job_id: str, error: str):
+        if self._on_failed:
+            self._on_failed(job_id, error)
+
+    def _submit(self, fn, job_id: str, *args, resumable: bool = False, **kwargs) -> Future:
+        future: Future = Future()
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("Local scraper backend is closed")
+            if len(self._workers) < self._max_workers:
+                worker = threading.Thread(
+                    target=self._work,
+                    daemon=True,
+                    name=f"ScrapeJob-{len(self._workers)}",
+                )
+                worker.start()
+                self._workers.append(worker)
+        future.add_done_callback(_log_job_failure)
+        self._queue.put((future, job_id, resumable, fn, (job_id, *args), kwargs))
+        return future
+
+    def _work(self):
+        while True:
+            item = self._queue.get()
+            if item is None:
+                return
+            future, job_id, resumable, fn, args, kwargs = item
+            if self._closed:
+                if future.cancel():
+                    self._fail(job_id, "Scraper shut down before the job started")
+                continue
+            if not future.set_running_or_notify_cancel():
+                continue
+            with self._lock:
+                self._running[job_id] = resumable
+            try:
+                future.set_result(fn(*args, **kwargs))
+            except BaseException as exc:  # noqa: BLE001
+                future.set_exception(exc)
+            finally:
+                with self._lock:
+                    self._running.pop(job_id, None)
 
     def dispatch_mode_scrape(self, job_id: str, mode_name: str, user_id: str, resume_state=None, *, mode_id: Optional[str] = None):
-        thread = threading.Thread(
-            target=self.job_processor.run_scrape_job,
-            args=(job_id, mode_name, user_id, resume_state),
-            kwargs={"mode_id": mode_id},
-            daemon=True,
-            name=f"ScrapeJob-{mode_name}",
+        return self._submit(
+            self.job_processor.run_scrape_job,
+            job_id,
+            mode_name,
+            user_id,
+            resume_state,
+            mode_id=mode_id,
+            resumable=True,
         )
-        thread.start()
 
     def dispatch_single_url_refresh(self, job_id, content_id, url, mode_name, user_id):
-        thread = threading.Thread(
-            target=self.job_processor.run_single_url_refresh,
-            args=(job_id, content_id, url, mode_name, user_id),
-            daemon=True,
-            name=f"RefreshJob-{content_id}",
-        )
-        thread.start()
+        return self._submit(self.job_processor.run_single_url_refresh, job_id, content_id, url, mode_name, user_id)
 
     def dispatch_delete_content(self, job_id, content_id, mode_name):
-        thread = threading.Thread(
-            target=self.job_processor.run_delete_job,
-            args=(job_id, content_id, mode_name),
-            daemon=True,
-            name=f"DeleteJob-{content_id}",
-        )
-        thread.start()
+        return self._submit(self.job_processor.run_delete_job, job_id, content_id, mode_name)
 
     def dispatch_verification(self, job_id, batch_size: int, filters: Optional[Dict[str, Any]] = None):
-        thread = threading.Thread(
-            target=self.job_processor.run_verification_job,
-            args=(job_id, batch_size, filters),
-            daemon=True,
-            name=f"VerificationJob-{job_id}",
-        )
-        thread.start()
+        return self._submit(self.job_processor.run_verification_job, job_id, batch_size, filters)
 
     def dispatch_site_delete(self, job_id, mode_name, domain):
-        thread = threading.Thread(
-            target=self.job_processor.run_site_delete_job,
-            args=(job_id, mode_name, domain),
-            daemon=True,
-            name=f"SiteDelete-{domain}",
-        )
-        thread.start()
+        return self._submit(self.job_processor.run_site_delete_job, job_id, mode_name, domain)
 
     def dispatch_api_target_scrape(
         self,
@@ -378,23 +686,97 @@ class _LocalScraperBackend:
         options: Optional[Dict[str, Any]] = None,
         timeout_ms: int = 30000,
     ):
-        thread = threading.Thread(
-            target=self.job_processor.run_api_target_scrape,
-            args=(job_id, url, options, target),
-            kwargs={"user_id": user_id, "timeout_ms": int(timeout_ms or 30000)},
-            daemon=True,
-            name=f"ApiTargetScrape-{job_id}",
+        return self._submit(
+            self.job_processor.run_api_target_scrape,
+            job_id,
+            url,
+            options,
+            target,
+            user_id=user_id,
+            timeout_ms=int(timeout_ms or 30000),
         )
-        thread.start()
+
+
+def _log_job_failure(future: Future):
+    # Thread targets used to surface uncaught errors via the thread excepthook; keep them visible.
+    if not future.cancelled() and future.exception() is not None:
+        logger.error("Local scraper job failed", exc_info=future.exception())
 
 
 # ---------------------------------------------------------------------- #
 # Remote backend
 # ---------------------------------------------------------------------- #
 class _SQSScraperBackend:
-    def __init__(self, sqs_client, queue_config: ScraperQueueConfig):
+    def __init__(self, sqs_client, queue_config: ScraperQueueConfig, *, on_deduped=None, on_failed=None):
         self._sqs = sqs_client
         self._config = queue_config
+        self._on_deduped = on_deduped
+        self._on_failed = on_failed
+        # Buffers are per thread so concurrent requests never flush each other's entries.
+        self._batch_state = threading.local()
+        self._dispatcher: Optional[_SQSBatchDispatcher] = None
+        if queue_config.batch_window_ms:
+            self._dispatcher = _SQSBatchDispatcher(sqs_client, queue_config.queue_url, queue_config.batch_window_ms)
+
+    def _state(self):
+        state = self._batch_state
+        if not hasattr(state, "pending"):
+            state.pending = []
+            state.job_ids = {}
+            state.depth = 0
+            state.seen = {}
+        return state
+
+    def begin_batch(self):
+        self._state().depth += 1
+
+    def end_batch(self):
+        state = self._state()
+        state.depth = max(0, state.depth - 1)
+        if state.depth == 0:
+            state.seen.clear()
+            self.flush()
+
+    def flush(self):
+        """
+        Send buffered entries via SendMessageBatch, retrying per-entry failures.
+
+        Entries that still fail mark their jobs failed rather than raising: the job documents
+        are already inserted, and the rest of the buffer must still be sent. Entries too large
+        to share a batch (large resume checkpoints) go out on their own via SendMessage.
+        """
+        state = self._state()
+        entries, state.pending = state.pending, []
+        job_ids = {entry["Id"]: state.job_ids.pop(entry["Id"], None) for entry in entries}
+        chunks, oversized = _split_message_batches(entries)
+        for chunk in chunks:
+            try:
+                failed = _send_message_batch(self._sqs, self._config.queue_url, chunk)
+            except Exception as exc:  # noqa: BLE001
+                logger.exception("SQS batch send failed")
+                failed = {entry["Id"]: {"Code": type(exc).__name__, "Message": str(exc)} for entry in chunk}
+            for entry_id, failure in failed.items():
+                self._fail_job(job_ids.get(entry_id), f"SQS send failed: {failure.get('Code')} {failure.get('Message')}")
+        for entry in oversized:
+            try:
+                _send_single_message(self._sqs, self._config.queue_url, entry)
+            except Exception as exc:  # noqa: BLE001
+                logger.exception("SQS send failed for oversized entry %s", entry["Id"])
+                self._fail_job(job_ids.get(entry["Id"]), f"SQS send failed: {exc}")
+
+    def _fail_job(self, job_id: Optional[str], error: str):
+        if job_id and self._on_failed:
+            self._on_failed(job_id, error)
+
+    def _on_dispatched(self, job_id: str, future: Future):
+        # Callers do not wait on the dispatcher's Future, so a rejected send must fail the job here.
+        exc = future.exception()
+        if exc is not None:
+            self._fail_job(job_id, f"SQS send failed: {exc}")
+
+    def close(self):
+        if self._dispatcher is not None:
+            self._dispatcher.close()
 
     def dispatch_mode_scrape(self, job_id, mode_name, user_id, resume_state=None, *, mode_id: Optional[str] = None):
         payload = {
@@ -403,7 +785,7 @@ class _SQSScraperBackend:
             "mode_id": mode_id,
             "resume_state": resume_state,
         }
-        self._send_request(job_id, "scrape", payload)
+        return self._send_request(job_id, "scrape", payload)
 
     def dispatch_single_url_refresh(self, job_id, content_id, url, mode_name, user_id):
         payload = {
@@ -412,22 +794,22 @@ class _SQSScraperBackend:
             "mode_name": mode_name,
             "user_id": user_id,
         }
-        self._send_request(job_id, "single_url_refresh", payload)
+        return self._send_request(job_id, "single_url_refresh", payload)
 
     def dispatch_delete_content(self, job_id, content_id, mode_name):
         payload = {
             "content_id": content_id,
             "mode_name": mode_name,
         }
-        self._send_request(job_id, "delete_content", payload)
+        return self._send_request(job_id, "delete_content", payload)
 
     def dispatch_verification(self, job_id, batch_size: int, filters: Optional[Dict[str, Any]] = None):
         payload = {"batch_size": batch_size, "filters": filters}
-        self._send_request(job_id, "verification", payload)
+        return self._send_request(job_id, "verification", payload)
 
     def dispatch_site_delete(self, job_id, mode_name, domain):
         payload = {"mode_name": mode_name, "domain": domain}
-        self._send_request(job_id, "site_delete", payload)
+        return self._send_request(job_id, "site_delete", payload)
 
     def dispatch_api_target_scrape(
         self,
@@ -446,7 +828,7 @@ class _SQSScraperBackend:
             "user_id": user_id,
             "timeout_ms": int(timeout_ms or 30000),
         }
-        self._send_request(job_id, "api_target_scrape", payload)
+        return self._send_request(job_id, "api_target_scrape", payload)
 
     def _send_request(self, job_id: str, job_type: str, payload: Dict[str, Any]):
         request = ScraperJobRequest(
@@ -455,12 +837,213 @@ class _SQSScraperBackend:
             payload=payload,
         )
         params = {
-            "QueueUrl": self._config.queue_url,
             "MessageBody": request.to_message(),
         }
         if self._config.message_group_id:
             params["MessageGroupId"] = self._config.message_group_id
-            params["MessageDeduplicationId"] = str(uuid4())
+            # Deterministic per job, so SQS collapses re-sends of the same job within its dedup window.
+            params["MessageDeduplicationId"] = hashlib.sha256(f"{job_type}:{job_id}".encode()).hexdigest()
+
+        state = self._state()
+        if state.depth:
+            key = _batch_dedup_key(job_type, payload)
+            if key is not None:
+                kept_job_id = state.seen.setdefault(key, str(job_id))
+                if kept_job_id != str(job_id):
+                    logger.debug("Dropping duplicate %s job %s (same work as %s)", job_type, job_id, kept_job_id)
+                    if self._on_deduped:
+                        self._on_deduped(str(job_id), kept_job_id)
+                    return None
+            entry_id = uuid4().hex
+            state.pending.append({"Id": entry_id, **params})
+            state.job_ids[entry_id] = str(job_id)
+            if len(state.pending) >= SQS_MAX_BATCH_SIZE:
+                self.flush()
+            return None
+
+        if self._dispatcher is not None:
+            future = self._dispatcher.submit({"Id": uuid4().hex, **params})
+            future.add_done_callback(lambda done: self._on_dispatched(str(job_id), done))
+            return future
+
+        self._sqs.send_message(QueueUrl=self._config.queue_url, **params)
+        return None
+
+
+def _normalize_api_target_request(
+    url: str,
+    target: Dict[str, Any],
+    options: Optional[Dict[str, Any]],
+    timeout_ms: int,
+) -> Tuple[str, Dict[str, Any], Optional[Dict[str, Any]], int]:
+    """Validate api_target_scrape inputs once; the stored job and the dispatch share the result."""
+    url = (url or "").strip()
+    if not url:
+        raise ValueError("url is required")
+    if not isinstance(target, dict):
+        raise ValueError("target must be an object")
+    target_type = target.get("type")
+    if not isinstance(target_type, str) or not target_type.strip():
+        raise ValueError("target.type is required")
+    if not isinstance(target.get("selectors"), dict):
+        raise ValueError("target.selectors must be an object")
+    if options is not None and not isinstance(options, dict):
+        raise ValueError("options must be an object")
+    try:
+        timeout_ms = int(timeout_ms or 30000)
+    except (TypeError, ValueError):
+        raise ValueError("timeout_ms must be an integer") from None
+    return url, target, options or None, timeout_ms
+
+
+def _batch_dedup_key(job_type: str, payload: Dict[str, Any]) -> Optional[Tuple[Any, ...]]:
+    fields = BATCH_DEDUP_KEY_FIELDS.get(job_type)
+    if not fields:
+        return None
+    values = tuple(payload.get(field) for field in fields)
+    if any(value is None for value in values):
+        return None
+    return (job_type, *values)
+
+
+def _message_bytes(entry: Dict[str, Any]) -> int:
+    """Bytes an entry counts against the SendMessageBatch payload limit."""
+    return sum(len(value.encode("utf-8")) for key, value in entry.items() if key != "Id" and isinstance(value, str))
+
+
+def _split_message_batches(
+    entries: List[Dict[str, Any]],
+) -> Tuple[List[List[Dict[str, Any]]], List[Dict[str, Any]]]:
+    """
+    Group entries into chunks within both SendMessageBatch limits, keeping their order.
+
+    Entries larger than a whole batch are returned separately to be sent one at a time.
+    """
+    chunks: List[List[Dict[str, Any]]] = []
+    oversized: List[Dict[str, Any]] = []
+    chunk: List[Dict[str, Any]] = []
+    chunk_bytes = 0
+    for entry in entries:
+        size = _message_bytes(entry)
+        if size > SQS_MAX_BATCH_BYTES:
+            oversized.append(entry)
+            continue
+        if chunk and (len(chunk) >= SQS_MAX_BATCH_SIZE or chunk_bytes + size > SQS_MAX_BATCH_BYTES):
+            chunks.append(chunk)
+            chunk, chunk_bytes = [], 0
+        chunk.append(entry)
+        chunk_bytes += size
+    if chunk:
+        chunks.append(chunk)
+    return chunks, oversized
+
+
+def _send_single_message(sqs_client, queue_url: str, entry: Dict[str, Any]):
+    params = {key: value for key, value in entry.items() if key != "Id"}
+    return sqs_client.send_message(QueueUrl=queue_url, **params)
+
+
+def _send_message_batch(sqs_client, queue_url: str, entries: List[Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
+    """Send up to 10 entries, retrying failed ones; return the entries that still failed keyed by Id."""
+    failed: List[Dict[str, Any]] = []
+    for _ in range(SQS_BATCH_RETRIES + 1):
+        response = sqs_client.send_message_batch(QueueUrl=queue_url, Entries=entries)
+        failed = response.get("Failed") or []
+        if not failed:
+            return {}
+        failed_ids = {item.get("Id") for item in failed}
+        entries = [entry for entry in entries if entry["Id"] in failed_ids]
+        # Sender faults (bad entry) will not succeed on retry.
+        if any(item.get("SenderFault") for item in failed):
+            break
+    for item in failed:
+        logger.error(
+            "SQS batch send failed for entry %s: %s %s",
+            item.get("Id"),
+            item.get("Code"),
+            item.get("Message"),
+        )
+    return {item.get("Id"): item for item in failed}
+
+
+class _SQSBatchDispatcher:
+    """
+    Coalesce messages from any thread into SendMessageBatch calls on a background thread.
+
+    A batch is sent once 10 entries accumulate or `batch_window_ms` passes after the
+    first one arrives; it is split further if it exceeds the SendMessageBatch size limit. `submit()` returns a Future that resolves once SQS accepts the entry.
+    """
+
+    def __init__(self, sqs_client, queue_url: str, batch_window_ms: int):
+        self._sqs = sqs_client
+        self._queue_url = queue_url
+        self._window = max(1, int(batch_window_ms)) / 1000.0
+        self._queue: "queue.SimpleQueue[Optional[Tuple[Dict[str, Any], Future]]]" = queue.SimpleQueue()
+        self._closed = False
+        self._thread = threading.Thread(target=self._run, daemon=True, name="SQSBatchDispatcher")
+        self._thread.start()
+        atexit.register(self.close)
+
+    def submit(self, entry: Dict[str, Any]) -> Future:
+        future: Future = Future()
+        if self._closed:
+            future.set_exception(RuntimeError("SQS batch dispatcher is closed"))
+            return future
+        self._queue.put((entry, future))
+        return future
+
+    def close(self, timeout: float = 5.0):
+        if self._closed:
+            return
+        self._closed = True
+        self._queue.put(None)
+        self._thread.join(timeout)
+
+    def _run(self):
+        stopping = False
+        while not stopping:
+            item = self._queue.get()
+            if item is None:
+                break
+            batch = [item]
+            deadline = time.monotonic() + self._window
+            while len(batch) < SQS_MAX_BATCH_SIZE:
+                remaining = deadline - time.monotonic()
+                try:
+                    item = self._queue.get(timeout=remaining) if remaining > 0 else self._queue.get_nowait()
+                except queue.Empty:
+                    break
+                if item is None:
+                    stopping = True
+                    break
+                batch.append(item)
+            self._send(batch)
 
-        self._sqs.send_message(**params)
+    def _send(self, batch: List[Tuple[Dict[str, Any], Future]]):
+        futures = {entry["Id"]: future for entry, future in batch}
+        chunks, oversized = _split_message_batches([entry for entry, _ in batch])
+        for chunk in chunks:
+            try:
+                failed = _send_message_batch(self._sqs, self._queue_url, chunk)
+            except Exception as exc:  # noqa: BLE001
+                logger.exception("SQS batch send failed")
+                for entry in chunk:
+                    futures[entry["Id"]].set_exception(exc)
+                continue
+            for entry in chunk:
+                failure = failed.get(entry["Id"])
+                if failure:
+                    futures[entry["Id"]].set_exception(
+                        RuntimeError(f"SQS rejected message: {failure.get('Code')} {failure.get('Message')}")
+                    )
+                else:
+                    futures[entry["Id"]].set_result(entry["Id"])
+        for entry in oversized:
+            try:
+                _send_single_message(self._sqs, self._queue_url, entry)
+            except Exception as exc:  # noqa: BLE001
+                logger.exception("SQS send failed for oversized entry %s", entry["Id"])
+                futures[entry["Id"]].set_exception(exc)
+            else:
+                futures[entry["Id"]].set_result(entry["Id"])
 
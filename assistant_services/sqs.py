@@ -0,0 +1,34 @@
+from __future__ import annotations
+
+from typing import Optional
+
+import boto3
+from botocore.config import Config
+from decouple import config
+
+
+def build_sqs_client(
+    region_name: str,
+    *,
+    aws_access_key_id: Optional[str] = None,
+    aws_secret_access_key: Optional[str] = None,
+):
+    """
+    Build an SQS client with a connection pool sized for concurrent dispatch.
+
+    botocore's default pool holds 10 connections, which caps in-flight sends from
+    request threads and the batch dispatcher. Adaptive retries back off on throttling
+    and TCP keepalive keeps idle pooled connections usable between bursts.
+    """
+    client_config = Config(
+        max_pool_connections=int(config("SQS_MAX_POOL_CONNECTIONS", default="50")),
+        retries={"max_attempts": 3, "mode": "adaptive"},
+        tcp_keepalive=True,
+    )
+    return boto3.client(
+        "sqs",
+        region_name=region_name,
+        aws_access_key_id=aws_access_key_id,
+        aws_secret_access_key=aws_secret_access_key,
+        config=client_config,
+    )
@@ -1,11 +1,42 @@
 from __future__ import annotations
 
+import contextvars
+import logging
 import re
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from functools import lru_cache
 from typing import Optional, Tuple, List, Dict, Any, Union
 from urllib.parse import quote_plus, urlencode
 from bson import ObjectId
+from pymongo import ReturnDocument
+
+logger = logging.getLogger(__name__)
+
+# Mode fields read by prompt building and the document intelligence hook (_id is always returned)
+_MODE_FIELDS = {
+    "name": 1,
+    "title": 1,
+    "description": 1,
+    "province": 1,
+    "tags": 1,
+    "preferred_sites": 1,
+    "blocked_sites": 1,
+    "allow_other_sites": 1,
+    "priority_source": 1,
+    "has_files": 1,
+    "has_scraped_content": 1,
+    "doc_intelligence_enabled": 1,
+    "doc_intelligence_settings": 1,
+}
+
+
+@lru_cache(maxsize=4096)
+def _oid(conversation_id: str) -> ObjectId:
+    """Parse a conversation id once; chat turns reuse the same few ids repeatedly."""
+    return ObjectId(conversation_id)
 
 
 class ConversationService:
@@ -20,6 +51,7 @@ class ConversationService:
         max_messages: int = 20,
         doc_intelligence_service=None,
         document_intelligence_enabled: bool = False,
+        speculative_upgrade: bool = False,
     ) -> None:
         self.client = client
         self.conversations = db.get_collection("conversations")
@@ -35,35 +67,64 @@ class ConversationService:
         self.max_message_chars = 800
         self.max_context_chars = 5000
         self.recent_history_limit = 9  # keep ~4 user/assistant turns, capped by char budget
+        self.message_cap_slack = 10  # trim history in batches instead of on every turn
+        self.summary_every_turns = 2  # unsummarized turns stay visible in the recent tail meanwhile
         self.mode_cache_ttl = 120  # seconds
+        self.mode_cache_size = 256  # misses are cached too, so unknown names must not grow it forever
         self._mode_cache: Dict[str, Dict[str, Any]] = {}
+        self._mode_cache_lock = threading.Lock()
+        # (mode, tag) -> prompt/tools built from the cached mode doc they were derived from
+        self._prompt_cache: Dict[Tuple[str, str], Dict[str, Any]] = {}
+        # Summary refreshes and history trimming run off the request path.
+        self._background_pool = ThreadPoolExecutor(max_workers=2, thread_name_prefix="ConversationBackground")
+        self._background_lock = threading.Lock()
+        self._background_in_flight: set = set()
+        # Message log inserts run alongside the conversation update so a turn waits one round trip.
+        self._write_pool = ThreadPoolExecutor(max_workers=4, thread_name_prefix="ConversationWrite")
+        # Optionally run the full model alongside the mini one instead of after an unconfident reply
+        self._speculative_pool = (
+            ThreadPoolExecutor(max_workers=8, thread_name_prefix="ConversationSpeculative")
+            if speculative_upgrade
+            else None
+        )
+
+        # Create indexes for history reads and cap trimming; _id matches the trim's tie-break sort
+        try:
+            self.messages.create_index([("conversation_id", 1), ("created_at", 1), ("_id", 1)])
+            # Stale-file cleanup only ever looks at conversations holding uploads
+            self.conversations.create_index(
+                [("updated_at", 1)],
+                partialFilterExpression={"uploaded_files": {"$exists": True}},
+            )
+            # Legacy summary lookups for conversations not yet migrated
+            self.summaries.create_index([("conversation_id", 1)])
+        except Exception:
+            pass  # Indexes may already exist
 
     # Public API ---------------------------------------------------------
-    def add_user_message(self, conversation_id: str, user_id: str, text: str) -> None:
-        conv_id = ObjectId(conversation_id)
+    def add_user_message(self, conversation_id: str, user_id: str, text: str) -> Dict[str, Any]:
+        """Store a user message; return the conversation's count, summary, and recent turns."""
+        return self._add_user_message(_oid(conversation_id), user_id, text)
+
+    def _add_user_message(self, conv_id: ObjectId, user_id: str, text: str) -> Dict[str, Any]:
         now = datetime.utcnow()
-        # ensure conversation exists
-        self.conversations.update_one(
-            {"_id": conv_id},
-            {
-                "$setOnInsert": {"user_id": user_id, "created_at": now},
-                "$set": {"updated_at": now},
-            },
-            upsert=True,
-        )
-        self.messages.insert_one(
+        # ensure conversation exists, count the message, and append it to the recent tail
+        conv_doc = self._record_message(
+            conv_id,
             {
                 "conversation_id": conv_id,
                 "role": "user",
                 "content": text,
                 "created_at": now,
-            }
+            },
+            set_on_insert={"user_id": user_id, "created_at": now, "history_inline": True},
         )
-        self._enforce_cap(conv_id)
+        self._enforce_cap(conv_id, conv_doc.get("message_count", 0))
+        return conv_doc
 
     def store_conversation_files(self, conversation_id: str, file_ids: List[str]) -> None:
         """Store uploaded file IDs with the conversation for future use."""
-        conv_id = ObjectId(conversation_id)
+        conv_id = _oid(conversation_id)
         self.conversations.update_one(
             {"_id": conv_id},
             {"$addToSet": {"uploaded_files": {"$each": file_ids}}},
@@ -72,76 +133,97 @@ class ConversationService:
 
     def get_conversation_files(self, conversation_id: str) -> List[str]:
         """Get all uploaded file IDs for a conversation."""
-        conv_id = ObjectId(conversation_id)
-        conv_doc = self.conversations.find_one({"_id": conv_id})
+        conv_id = _oid(conversation_id)
+        conv_doc = self.conversations.find_one({"_id": conv_id}, {"_id": 0, "uploaded_files": 1})
         return conv_doc.get("uploaded_files", []) if conv_doc else []
 
     def clear_conversation_files(self, conversation_id: str) -> List[str]:
         """Clear and return all uploaded file IDs for a conversation."""
-        conv_id = ObjectId(conversation_id)
-        conv_doc = self.conversations.find_one({"_id": conv_id})
-        file_ids = conv_doc.get("uploaded_files", []) if conv_doc else []
-        
-        # Remove files from conversation
-        self.conversations.update_one(
+        conv_id = _oid(conversation_id)
+        # Read and clear in one atomic step so files stored concurrently are not dropped unreturned
+        conv_doc = self.conversations.find_one_and_update(
             {"_id": conv_id},
-            {"$unset": {"uploaded_files": ""}}
+            {"$unset": {"uploaded_files": ""}},
+            projection={"_id": 0, "uploaded_files": 1},
+            return_document=ReturnDocument.BEFORE,
         )
-        
-        return file_ids
+        return conv_doc.get("uploaded_files", []) if conv_doc else []
 
     def cleanup_old_files(self, days_old: int = 7) -> List[str]:
         """Clean up files from conversations older than specified days."""
         from datetime import datetime, timedelta
         
         cutoff_date = datetime.utcnow() - timedelta(days=days_old)
-        old_conversations = self.conversations.find({
-            "updated_at": {"$lt": cutoff_date},
-            "uploaded_files": {"$exists": True, "$ne": []}
-        })
+        old_conversations = self.conversations.find(
+            {
+                "updated_at": {"$lt": cutoff_date},
+                "uploaded_files": {"$exists": True, "$ne": []}
+            },
+            {"_id": 1, "uploaded_files": 1},
+        )
         
         all_old_files = []
+        conv_ids = []
         for conv in old_conversations:
             file_ids = conv.get("uploaded_files", [])
             all_old_files.extend(file_ids)
-            
-            # Remove files from conversation
-            self.conversations.update_one(
-                {"_id": conv["_id"]},
-                {"$unset": {"uploaded_files": ""}}
-            )
+            conv_ids.append(conv["_id"])
+            # Remove files from conversations in batches rather than one update per conversation
+            if len(conv_ids) >= 500:
+                self._unset_conversation_files(conv_ids)
+                conv_ids = []
+        if conv_ids:
+            self._unset_conversation_files(conv_ids)
         
         return all_old_files
 
-    def _build_context(self, conversation_id: str) -> str:
+    def _unset_conversation_files(self, conv_ids: List[ObjectId]) -> None:
+        self.conversations.update_many(
+            {"_id": {"$in": conv_ids}},
+            {"$unset": {"uploaded_files": ""}}
+        )
+
+    def _build_context(self, conv_id: ObjectId, conv_doc: Optional[Dict[str, Any]] = None) -> str:
         """Build summary and recent history context for the model."""
-        conv_id = ObjectId(conversation_id)
-        summary_doc = self.summaries.find_one({"conversation_id": conv_id})
-        summary_raw = summary_doc.get("summary_text", "") if summary_doc else ""
+        conv_doc = conv_doc or {}
+        summary_raw = conv_doc.get("summary_text")
+        if summary_raw is None and conv_doc.get("history_inline"):
+            summary_raw = ""
+        elif summary_raw is None:
+            # Conversations summarized before the summary moved onto the conversation doc
+            summary_doc = self.summaries.find_one(
+                {"conversation_id": conv_id}, {"_id": 0, "summary_text": 1}
+            )
+            summary_raw = summary_doc.get("summary_text", "") if summary_doc else ""
         summary = self._truncate_text(summary_raw, self.max_summary_chars)
 
-        # Grab the latest 8 messages before the newest user message
-        all_msgs = list(
-            self.messages.find({"conversation_id": conv_id})
-            .sort("created_at", -1)
-            .limit(self.recent_history_limit)
-        )
-        # first item is the latest user message, the rest are previous turns
-        recent_history = list(reversed(all_msgs[1:]))
+        recent_msgs = conv_doc.get("recent_msgs") or []
+        if conv_doc.get("history_inline") or len(recent_msgs) >= self.recent_history_limit:
+            # The conversation doc carries the tail, oldest first, ending with the newest user message
+            previous_newest_first = recent_msgs[-2::-1]
+        else:
+            # Grab the latest 8 messages before the newest user message
+            all_msgs = list(
+                self.messages.find({"conversation_id": conv_id}, {"_id": 0, "role": 1, "content": 1})
+                .sort("created_at", -1)
+                .limit(self.recent_history_limit)
+            )
+            # first item is the latest user message, the rest are previous turns
+            previous_newest_first = all_msgs[1:]
         recent_text_parts = []
         budget = max(self.max_context_chars - len(summary), 0)
-        for message in recent_history:
-            # Cap each message and respect an overall budget to keep latency low
-            content = self._truncate_text(
-                message.get("content", ""), self.max_message_chars
+        # Fill the budget from the newest turn back so an overflow drops the oldest turns
+        for message in previous_newest_first:
+            # Each message is capped when formatted; respect an overall budget to keep latency low
+            entry = message.get("line") or self._format_turn(
+                message.get("role", "unknown"), message.get("content", "")
             )
-            entry = f"{message.get('role', 'unknown').capitalize()}: {content}"
             if budget - len(entry) < 0:
                 break
             recent_text_parts.append(entry)
             budget -= len(entry)
 
-        recent_text = "\n".join(recent_text_parts)
+        recent_text = "\n".join(reversed(recent_text_parts))
 
         context = f"<SUMMARY>\n{summary}\n<RECENT_TURNS>\n{recent_text}\n"
         return context
@@ -154,18 +236,55 @@ class ConversationService:
         now = time.time()
         if cached and (now - cached["ts"]) < self.mode_cache_ttl:
             return cached["doc"]
-        doc = self.modes.find_one({"name": mode})
-        self._mode_cache[mode] = {"doc": doc, "ts": now}
+        doc = self.modes.find_one({"name": mode}, _MODE_FIELDS)
+        with self._mode_cache_lock:
+            self._mode_cache.pop(mode, None)
+            self._mode_cache[mode] = {"doc": doc, "ts": now}
+            # Dicts keep insertion order, so the first key is the least recently loaded mode
+            while len(self._mode_cache) > self.mode_cache_size:
+                self._mode_cache.pop(next(iter(self._mode_cache)))
         return doc
 
+    def invalidate_mode(self, mode: Optional[str]) -> None:
+        """Drop cached config for a mode after an admin edit or delete."""
+        if not mode:
+            return
+        with self._mode_cache_lock:
+            self._mode_cache.pop(mode, None)
+        # list() snapshots the keys in one step, so concurrent inserts cannot break the loop
+        for key in list(self._prompt_cache):
+            if key[0] == mode:
+                self._prompt_cache.pop(key, None)
+
+    def _format_turn(self, role: str, content: str) -> str:
+        """Render one message as a capped `Role: content` context line."""
+        return f"{role.capitalize()}: {self._truncate_text(content, self.max_message_chars)}"
+
+    @staticmethod
+    def _is_confident(res) -> bool:
+        """True unless the first output content reports a confidence below 0.5."""
+        try:
+            content = res.output[0].content[0]
+        except (AttributeError, IndexError, TypeError):
+            # No content to inspect (e.g. a function call); assume confident to avoid double calls
+            return True
+        if isinstance(content, dict):
+            confidence = content.get("confidence")
+        else:
+            confidence = getattr(content, "confidence", None)
+        try:
+            return confidence is None or confidence >= 0.5
+        except TypeError:
+            return True
+
     @staticmethod
     def _truncate_text(text: str, max_chars: int) -> str:
         """Keep head/tail of long text to preserve intent while trimming tokens."""
         if not text or len(text) <= max_chars:
             return text
-        head = text[: max_chars // 2]
-        tail = text[-max_chars // 2 :]
-        return f"{head} ... {tail}"
+        # Index the tail from the end explicitly: a negative slice of -0 would keep the whole text
+        half = max_chars // 2
+        return f"{text[:half]} ... {text[len(text) - half:]}"
 
     @staticmethod
     def _vector_share_key_for_mode(mode_name: str) -> str:
@@ -186,6 +305,21 @@ class ConversationService:
             safe = "default"
         return f"shared_with_{safe}"
 
+    def _get_prompt_and_tools(
+        self, mode_doc: Optional[Dict[str, Any]], mode: str, tag: str
+    ) -> Tuple[str, List[Dict], List[Dict[str, Any]]]:
+        """Reuse the prompt and tools built for this mode doc; rebuild once the mode cache refreshes."""
+        if not mode_doc:
+            return self._build_prompt_and_tools(mode_doc, mode, tag)
+        # Only the mode's own tags change the output, so arbitrary request tags share one entry
+        key = (mode, tag if tag and tag in (mode_doc.get("tags") or []) else "")
+        cached = self._prompt_cache.get(key)
+        if cached and cached["doc"] is mode_doc:
+            return cached["result"]
+        result = self._build_prompt_and_tools(mode_doc, mode, tag)
+        self._prompt_cache[key] = {"doc": mode_doc, "result": result}
+        return result
+
     def _build_prompt_and_tools(
         self, mode_doc: Optional[Dict[str, Any]], mode: str, tag: str
     ) -> Tuple[str, List[Dict], List[Dict[str, Any]]]:
@@ -456,8 +590,8 @@ class ConversationService:
         Tuple[str, str, Optional[dict]],
         Tuple[str, str, Optional[dict], List[Dict[str, Any]]],
     ]:
-        conv_id = ObjectId(conversation_id)
-        self.add_user_message(conversation_id, user_id, text)
+        conv_id = _oid(conversation_id)
+        conv_doc = self._add_user_message(conv_id, user_id, text)
         mode_doc = self._get_mode_doc(mode) if mode else None
         doc_session_id = doc_intel_session_id or conversation_id
 
@@ -473,14 +607,24 @@ class ConversationService:
                     conv_id, doc_context, text, include_jobs=include_jobs
                 )
 
-        context = self._build_context(conversation_id)
-        system_prompt, tools, data_sources = self._build_prompt_and_tools(mode_doc, mode, tag)
+        context = self._build_context(conv_id, conv_doc)
+        system_prompt, tools, data_sources = self._get_prompt_and_tools(mode_doc, mode, tag)
 
         full_system_prompt = f"{system_prompt}\n{context}"
         
-        # Get all files for this conversation (previous + new)
-        conversation_files = self.get_conversation_files(conversation_id)
-        all_file_ids = list(set((file_ids or []) + conversation_files))  # Combine and deduplicate
+        # Get all files for this conversation (previous + new); the message write returned them
+        conversation_files = conv_doc.get("uploaded_files") or []
+        # Combine and deduplicate, keeping earlier files first so the input order is stable across turns
+        all_file_ids = list(dict.fromkeys(conversation_files + (file_ids or [])))
+        # message_count only counts from the first turn since the counter was added, so it is
+        # trusted for conversations created since then; older ones are past their opening turns.
+        # Locally generated ids (doc-intel answers) name no OpenAI response to chain from.
+        chain_previous = (
+            bool(previous_response_id)
+            and previous_response_id.startswith("resp_")
+            and bool(conv_doc.get("history_inline"))
+            and conv_doc.get("message_count", 0) <= 6
+        )
 
         def _call_model(model_name: str, system_prompt_override: Optional[str] = None):
             user_content: List[Dict] = [
@@ -504,10 +648,7 @@ class ConversationService:
                     {"role": "user", "content": user_content},
                 ],
             }
-            if (
-                previous_response_id
-                and self.messages.count_documents({"conversation_id": conv_id}) <= 6
-            ):
+            if chain_previous:
                 params["previous_response_id"] = previous_response_id
 
             if data_sources:
@@ -517,27 +658,6 @@ class ConversationService:
             
             return self.client.responses.create(**params)
 
-        def _is_confident(res) -> bool:
-            try:
-                # Check if the response has the expected structure
-                if hasattr(res, 'output') and res.output and len(res.output) > 0:
-                    output = res.output[0]
-                    if hasattr(output, 'content') and output.content and len(output.content) > 0:
-                        content = output.content[0]
-                        if isinstance(content, dict):
-                            confidence = content.get("confidence")
-                        else:
-                            confidence = getattr(content, "confidence", None)
-                        
-                        # Return True if confidence is None (no confidence score) or >= 0.5
-                        return confidence is None or confidence >= 0.5
-                
-                # If we can't find confidence info, assume confident
-                return True
-            except Exception:
-                # If anything goes wrong, assume confident to avoid double calls
-                return True
-
         def _has_tool_call(res) -> bool:
             if not hasattr(res, "output") or not res.output:
                 return False
@@ -645,10 +765,16 @@ class ConversationService:
                 return text_value[: max_len - 3] + "..."
             return text_value
 
+        # Tool modes rewrite the first response, so only plain modes can use a speculative answer
+        speculative = None
+        if self._speculative_pool and mode not in ("talentcentral", "permitsca"):
+            speculative = self._speculative_pool.submit(
+                contextvars.copy_context().run, _call_model, "gpt-4.1"
+            )
         response = _call_model("gpt-4.1-mini")
         if mode == "talentcentral":
-            print(
-                "[talentcentral] initial model response",
+            logger.info(
+                "[talentcentral] initial model response: %s",
                 {
                     "response_id": getattr(response, "id", None),
                     "output_items": len(getattr(response, "output", []) or []),
@@ -670,8 +796,8 @@ class ConversationService:
                 "resume may already be available to tools. Prefer using search_jobs or "
                 "get_resume_context before asking for an upload."
             )
-            print(
-                "[talentcentral] retrying initial response",
+            logger.info(
+                "[talentcentral] retrying initial response: %s",
                 {
                     "reason": "resume_intent_with_upload_request_and_no_tool_call",
                     "user_id": str(user_id),
@@ -679,8 +805,8 @@ class ConversationService:
                 },
             )
             response = _call_model("gpt-4.1-mini", system_prompt_override=retry_prompt)
-            print(
-                "[talentcentral] retry response",
+            logger.info(
+                "[talentcentral] retry response: %s",
                 {
                     "response_id": getattr(response, "id", None),
                     "output_items": len(getattr(response, "output", []) or []),
@@ -749,8 +875,8 @@ class ConversationService:
                     )
                 ]
                 if not function_calls:
-                    print(
-                        "[talentcentral] tool loop stopped",
+                    logger.info(
+                        "[talentcentral] tool loop stopped: %s",
                         {
                             "round": round_index + 1,
                             "reason": "no_function_calls",
@@ -762,8 +888,8 @@ class ConversationService:
 
                 called_function = True
                 follow_up_items = []
-                print(
-                    "[talentcentral] tool round start",
+                logger.info(
+                    "[talentcentral] tool round start: %s",
                     {
                         "round": round_index + 1,
                         "function_count": len(function_calls),
@@ -786,8 +912,8 @@ class ConversationService:
                             function_args = {}
                     elif not isinstance(function_args, dict):
                         function_args = {}
-                    print(
-                        "[talentcentral] executing tool",
+                    logger.info(
+                        "[talentcentral] executing tool: %s",
                         {
                             "round": round_index + 1,
                             "function": function_name,
@@ -811,8 +937,8 @@ class ConversationService:
                             limit=limit,
                             use_profile=use_profile,
                         )
-                        print(
-                            "[talentcentral] search_jobs completed",
+                        logger.info(
+                            "[talentcentral] search_jobs completed: %s",
                             {
                                 "round": round_index + 1,
                                 "query": query_text,
@@ -960,8 +1086,8 @@ class ConversationService:
                         keywords = resume_context.get("top_skills_keywords") or []
                         signals = resume_context.get("experience_signals") or []
                         cache_hit = bool(resume_context.get("cache_hit"))
-                        print(
-                            "[talentcentral] get_resume_context completed",
+                        logger.info(
+                            "[talentcentral] get_resume_context completed: %s",
                             {
                                 "round": round_index + 1,
                                 "max_chars": max_chars,
@@ -996,8 +1122,8 @@ class ConversationService:
                             "type": "function_call_output",
                         }
                     )
-                    print(
-                        "[talentcentral] tool output prepared",
+                    logger.info(
+                        "[talentcentral] tool output prepared: %s",
                         {
                             "round": round_index + 1,
                             "function": function_name,
@@ -1015,8 +1141,8 @@ class ConversationService:
                         *follow_up_items,
                     ],
                 )
-                print(
-                    "[talentcentral] post-tool model response",
+                logger.info(
+                    "[talentcentral] post-tool model response: %s",
                     {
                         "round": round_index + 1,
                         "response_id": getattr(response, "id", None),
@@ -1026,8 +1152,8 @@ class ConversationService:
                     },
                 )
             else:
-                print(
-                    "[talentcentral] tool loop reached max rounds",
+                logger.info(
+                    "[talentcentral] tool loop reached max rounds: %s",
                     {
                         "max_rounds": max_tool_round_trips,
                         "response_id": getattr(response, "id", None),
@@ -1050,8 +1176,8 @@ class ConversationService:
             fallback_reason = "deferred_reply_without_search_jobs_call"
             if _claims_no_jobs(getattr(response, "output_text", "")):
                 fallback_reason = "no_jobs_claim_without_search_jobs_call"
-            print(
-                "[talentcentral] forcing search_jobs fallback",
+            logger.info(
+                "[talentcentral] forcing search_jobs fallback: %s",
                 {
                     "reason": fallback_reason,
                     "response_id": getattr(response, "id", None),
@@ -1188,8 +1314,8 @@ class ConversationService:
             else:
                 tool_result = f"No jobs found matching '{fallback_query_text}'."
 
-            print(
-                "[talentcentral] forced search_jobs completed",
+            logger.info(
+                "[talentcentral] forced search_jobs completed: %s",
                 {
                     "results_count": len(search_results or []),
                     "tool_output_chars": len(tool_result or ""),
@@ -1210,8 +1336,8 @@ class ConversationService:
                     },
                 ],
             )
-            print(
-                "[talentcentral] post-forced-search response",
+            logger.info(
+                "[talentcentral] post-forced-search response: %s",
                 {
                     "response_id": getattr(response, "id", None),
                     "output_items": len(getattr(response, "output", []) or []),
@@ -1220,15 +1346,18 @@ class ConversationService:
                 },
             )
         
-        if not _is_confident(response) and not called_function:
-            print("response from mini model is not confident, calling gpt-5.1")
-            response = _call_model("gpt-4.1")
+        if not self._is_confident(response) and not called_function:
+            logger.info("response from mini model is not confident, calling gpt-4.1")
+            response = speculative.result() if speculative else _call_model("gpt-4.1")
+        elif speculative:
+            # Only stops a call that has not started; a running one finishes and is discarded
+            speculative.cancel()
         output_text = response.output_text
         now = datetime.utcnow()
         usage = response.usage.total_tokens if response.usage else None
         if mode == "talentcentral":
-            print(
-                "[talentcentral] final assistant response",
+            logger.info(
+                "[talentcentral] final assistant response: %s",
                 {
                     "response_id": getattr(response, "id", None),
                     "called_function": called_function,
@@ -1238,7 +1367,8 @@ class ConversationService:
                     "output_preview": _safe_preview(output_text),
                 },
             )
-        self.messages.insert_one(
+        conv_doc = self._record_message(
+            conv_id,
             {
                 "conversation_id": conv_id,
                 "role": "assistant",
@@ -1246,50 +1376,193 @@ class ConversationService:
                 "model": response.model,
                 "usage": usage,
                 "created_at": now,
-            }
+            },
         )
-        self.conversations.update_one({"_id": conv_id}, {"$set": {"updated_at": now}})
-        self._update_summary(conv_id, text, output_text)
-        self._enforce_cap(conv_id)
+        self._schedule_summary_update(conv_id, conv_doc)
+        self._enforce_cap(conv_id, conv_doc.get("message_count", 0))
         if include_jobs and mode == "talentcentral":
             return output_text, response.id, usage, jobs_for_api
         return output_text, response.id, usage
     
 
     # Internal helpers ---------------------------------------------------
-    def _update_summary(self, conv_id: ObjectId, user_text: str, assistant_text: str) -> None:
-        summary_doc = self.summaries.find_one({"conversation_id": conv_id})
-        prev_summary = summary_doc.get("summary_text", "") if summary_doc else ""
+    def _submit_background(self, key: Tuple[str, ObjectId], fn, *args) -> None:
+        """Run fn on the background pool unless a task with the same key is still running."""
+        with self._background_lock:
+            if key in self._background_in_flight:
+                return
+            self._background_in_flight.add(key)
+        try:
+            self._background_pool.submit(self._run_background, key, fn, *args)
+        except RuntimeError:
+            # Pool is shut down (interpreter exit); the next turn will retry.
+            with self._background_lock:
+                self._background_in_flight.discard(key)
+
+    def _run_background(self, key: Tuple[str, ObjectId], fn, *args) -> None:
+        try:
+            fn(*args)
+        except Exception as e:  # noqa: BLE001
+            logger.warning("Background %s failed for conversation %s: %s", key[0], key[1], e)
+        finally:
+            with self._background_lock:
+                self._background_in_flight.discard(key)
+
+    def _schedule_summary_update(self, conv_id: ObjectId, conv_doc: Dict[str, Any]) -> None:
+        """Refresh the summary in the background every few turns, folding in the unsummarized ones."""
+        pending = conv_doc.get("summary_pending", 0)
+        if pending < 2 * self.summary_every_turns:
+            return
+        recent_msgs = conv_doc.get("recent_msgs") or []
+        turn_lines: Optional[List[str]] = None
+        # recent_msgs is capped; if summaries fell further behind, the task reads `messages` instead
+        if pending <= len(recent_msgs):
+            turn_lines = [
+                message.get("line")
+                or self._format_turn(message.get("role", "unknown"), message.get("content", ""))
+                for message in recent_msgs[-pending:]
+            ]
+        self._submit_background(
+            ("summary update", conv_id),
+            self._update_summary,
+            conv_id,
+            turn_lines,
+            pending,
+            conv_doc.get("summary_text"),
+            not conv_doc.get("history_inline"),
+        )
+
+    def _update_summary(
+        self,
+        conv_id: ObjectId,
+        turn_lines: Optional[List[str]],
+        pending: int,
+        stored_summary: Optional[str] = None,
+        check_legacy: bool = True,
+    ) -> None:
+        """Fold recent turns into the summary stored on the conversation doc (None = none yet)."""
+        if turn_lines is None:
+            newest_first = list(
+                self.messages.find({"conversation_id": conv_id}, {"_id": 0, "role": 1, "content": 1})
+                .sort([("created_at", -1), ("_id", -1)])
+                .limit(pending)
+            )
+            turn_lines = [
+                self._format_turn(message.get("role", "unknown"), message.get("content", ""))
+                for message in reversed(newest_first)
+            ]
+        prev_summary = stored_summary
+        if prev_summary is None:
+            prev_summary = ""
+            if check_legacy:
+                summary_doc = self.summaries.find_one(
+                    {"conversation_id": conv_id}, {"_id": 0, "summary_text": 1}
+                )
+                prev_summary = summary_doc.get("summary_text", "") if summary_doc else ""
         prompt = (
             "Update the running conversation summary in 2-6 sentences.\n"
             f"<SUMMARY>\n{prev_summary}\n"
-            f"<NEW_TURN>\nUser: {user_text}\nAssistant: {assistant_text}"
+            "<NEW_TURNS>\n" + "\n".join(turn_lines)
         )
         res = self.client.responses.create(model="gpt-4o-mini", input=prompt)
         new_summary = res.output_text.strip()
-        self.summaries.update_one(
-            {"conversation_id": conv_id},
+        # Stored on the conversation so the next turn reads it with the message write. Matching on
+        # the summary this was built from keeps a newer one from another worker from being replaced.
+        self.conversations.update_one(
+            {"_id": conv_id, "summary_text": stored_summary},
             {
-                "$set": {
-                    "summary_text": new_summary,
-                    "updated_at": datetime.utcnow(),
-                }
+                "$set": {"summary_text": new_summary, "summary_updated_at": datetime.utcnow()},
+                "$inc": {"summary_pending": -pending},
             },
-            upsert=True,
         )
 
-    def _enforce_cap(self, conv_id: ObjectId) -> None:
-        count = self.messages.count_documents({"conversation_id": conv_id})
-        if count > self.max_messages:
-            excess = count - self.max_messages
-            old_ids = [
-                m["_id"]
-                for m in self.messages.find({"conversation_id": conv_id})
-                .sort("created_at", 1)
-                .limit(excess)
-            ]
-            if old_ids:
-                self.messages.delete_many({"_id": {"$in": old_ids}})
+    def _record_message(
+        self,
+        conv_id: ObjectId,
+        message_doc: Dict[str, Any],
+        set_on_insert: Optional[Dict[str, Any]] = None,
+    ) -> Dict[str, Any]:
+        """Insert a message and update its conversation doc concurrently; return the conversation doc."""
+        # The two writes touch different collections and neither needs the other's result.
+        ctx = contextvars.copy_context()
+        insert_future = self._write_pool.submit(ctx.run, self.messages.insert_one, message_doc)
+        try:
+            conv_doc = self._touch_conversation(
+                conv_id,
+                message_doc["created_at"],
+                role=message_doc["role"],
+                content=message_doc["content"],
+                set_on_insert=set_on_insert,
+            )
+        finally:
+            insert_future.result()
+        return conv_doc
+
+    def _touch_conversation(
+        self,
+        conv_id: ObjectId,
+        now: datetime,
+        role: str,
+        content: str,
+        set_on_insert: Optional[Dict[str, Any]] = None,
+    ) -> Dict[str, Any]:
+        """Record a message on the conversation doc; return its count, summary, recent tail, and files."""
+        # Stored already formatted so building the context is just a join
+        recent_entry = {"role": role, "line": self._format_turn(role, content)}
+        update: Dict[str, Any] = {
+            "$set": {"updated_at": now},
+            "$inc": {"message_count": 1, "summary_pending": 1},
+            "$push": {
+                "recent_msgs": {"$each": [recent_entry], "$slice": -self.recent_history_limit}
+            },
+        }
+        if set_on_insert:
+            update["$setOnInsert"] = set_on_insert
+        return self.conversations.find_one_and_update(
+            {"_id": conv_id},
+            update,
+            projection={
+                "_id": 0,
+                "message_count": 1,
+                "recent_msgs": 1,
+                "summary_text": 1,
+                "summary_pending": 1,
+                "history_inline": 1,
+                "uploaded_files": 1,
+            },
+            upsert=True,
+            return_document=ReturnDocument.AFTER,
+        ) or {}
+
+    def _enforce_cap(self, conv_id: ObjectId, message_count: int) -> None:
+        """Schedule a history trim once the stored count passes the cap plus some slack."""
+        if message_count <= self.max_messages + self.message_cap_slack:
+            return
+        self._submit_background(("history trim", conv_id), self._trim_history, conv_id)
+
+    def _trim_history(self, conv_id: ObjectId) -> None:
+        # Newest message outside the kept window; it and everything older is dropped.
+        # _id breaks ties so messages sharing the cutoff timestamp inside the window are kept.
+        cutoff = self.messages.find_one(
+            {"conversation_id": conv_id},
+            {"_id": 1, "created_at": 1},
+            sort=[("created_at", -1), ("_id", -1)],
+            skip=self.max_messages,
+        )
+        if cutoff:
+            self.messages.delete_many(
+                {
+                    "conversation_id": conv_id,
+                    "$or": [
+                        {"created_at": {"$lt": cutoff["created_at"]}},
+                        {"created_at": cutoff["created_at"], "_id": {"$lte": cutoff["_id"]}},
+                    ],
+                }
+            )
+        # Reset to the number kept; this also corrects conversations that predate the counter.
+        self.conversations.update_one(
+            {"_id": conv_id}, {"$set": {"message_count": self.max_messages}}
+        )
 
     def _respond_with_manual_text(
         self,
@@ -1304,7 +1577,8 @@ class ConversationService:
         response_id = str(ObjectId())
         now = datetime.utcnow()
         usage = None
-        self.messages.insert_one(
+        conv_doc = self._record_message(
+            conv_id,
             {
                 "conversation_id": conv_id,
                 "role": "assistant",
@@ -1312,11 +1586,10 @@ class ConversationService:
                 "model": "doc_intel",
                 "usage": usage,
                 "created_at": now,
-            }
+            },
         )
-        self.conversations.update_one({"_id": conv_id}, {"$set": {"updated_at": now}})
-        self._update_summary(conv_id, user_text, assistant_text)
-        self._enforce_cap(conv_id)
+        self._schedule_summary_update(conv_id, conv_doc)
+        self._enforce_cap(conv_id, conv_doc.get("message_count", 0))
         if include_jobs:
             return assistant_text, response_id, usage, []
         return assistant_text, response_id, usage
\ No newline at end of file
@@ -1,12 +1,18 @@
 from __future__ import annotations
 
 import os
+import re
 import shutil
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from datetime import datetime, timedelta
 from typing import Any, Dict, Iterable, List, Optional
 from uuid import uuid4
 
+from pymongo import UpdateOne
+
 from models.metadata import BidPackage, DocumentMetadata, ProjectContext, Section
 from tools import DocumentToolbox
 
@@ -14,6 +20,28 @@ import logging
 
 logger = logging.getLogger(__name__)
 
+# Intent keywords, each group in priority order
+_INTENT_ACTIONS = (
+    ("build_package", ("bid package", "package", "combine")),
+    ("search", ("search", "show", "find", "list")),
+    ("extract", ("count", "extract", "how many")),
+)
+_INTENT_OUTPUTS = ("zip", "pdf")
+_INTENT_TRADES = ("electrical", "mechanical", "civil", "architectural", "structural")
+# Zero-width lookahead so overlapping keywords are all reported, matching plain substring checks
+_INTENT_KEYWORD_RE = re.compile(
+    "(?=({}))".format(
+        "|".join(
+            re.escape(keyword)
+            for keyword in [
+                *(keyword for _, keywords in _INTENT_ACTIONS for keyword in keywords),
+                *_INTENT_OUTPUTS,
+                *_INTENT_TRADES,
+            ]
+        )
+    )
+)
+
 
 class DocumentIntelligenceService:
     """
@@ -29,6 +57,9 @@ class DocumentIntelligenceService:
         storage_dir: str,
         toolbox: DocumentToolbox,
         expiry_minutes: int = 30,
+        max_ingest_workers: Optional[int] = None,
+        project_cache_ttl: float = 5,
+        max_text_bytes: int = 5 * 1024 * 1024,
     ):
         self.modes = modes_collection
         self.projects = projects_collection
@@ -38,6 +69,17 @@ class DocumentIntelligenceService:
         self.expiry_minutes = expiry_minutes
         # PDF safety limits: allow large files, but stop runaway parsing
         self.max_pdf_seconds = 90
+        # Plain-text uploads are read up to this many bytes; the rest is dropped
+        self.max_text_bytes = max_text_bytes
+        # PDF parsing runs in a subprocess, OCR shells out to tesseract and embeddings are an
+        # API call, so threads overlap the per-file work without pickling the toolbox.
+        self.max_ingest_workers = max_ingest_workers or min(4, os.cpu_count() or 1)
+        # A chat turn reads the same project several times (intent, search, planning). Read-only
+        # lookups share a briefly cached copy; writers always load fresh and drop the entry.
+        self.project_cache_ttl = project_cache_ttl  # seconds
+        self.project_cache_size = 256
+        self._project_cache: Dict[str, Dict[str, Any]] = {}
+        self._project_cache_lock = threading.Lock()
 
     # ------------------------------------------------------------------ #
     # Public API
@@ -48,70 +90,147 @@ class DocumentIntelligenceService:
         Returns the number of cleaned up projects.
         """
         expiry_threshold = datetime.utcnow() - timedelta(minutes=self.expiry_minutes)
-        projects = self.projects.find({"updated_at": {"$lt": expiry_threshold.isoformat()}})
-        
-        cleaned_count = 0
+        # ProjectContext stores ISO strings, but audited updates overwrite updated_at with a datetime
+        expired = {
+            "$or": [
+                {"updated_at": {"$lt": expiry_threshold.isoformat()}},
+                {"updated_at": {"$lt": expiry_threshold}},
+            ]
+        }
+        projects = self.projects.find(expired, {"_id": 0, "session_id": 1, "files": 1, "packages": 1})
+
+        candidates = {}
         for doc in projects:
             project = ProjectContext.from_dict(doc)
-            self._delete_project_files(project)
-            self.projects.delete_one({"session_id": project.session_id})
-            cleaned_count += 1
-            
+            candidates[project.session_id] = project
+
+        cleaned_count = 0
+        if candidates:
+            session_ids = list(candidates)
+            # Delete the documents first; a project touched since the find survives and keeps its files
+            cleaned_count = self.projects.delete_many({"session_id": {"$in": session_ids}, **expired}).deleted_count
+            survivors = {
+                doc["session_id"]
+                for doc in self.projects.find({"session_id": {"$in": session_ids}}, {"_id": 0, "session_id": 1})
+            }
+            for session_id in session_ids:
+                self._invalidate_project(session_id)
+            for session_id, project in candidates.items():
+                if session_id not in survivors:
+                    self._delete_project_files(project)
+
         if cleaned_count > 0:
             logger.info(f"DocIntel: cleaned up {cleaned_count} expired projects.")
             
         return cleaned_count
 
     def _delete_project_files(self, project: ProjectContext) -> None:
-        # Delete document files
+        # Upload directories (one per document) and generated package files
+        targets = []
         for document in project.files:
             try:
                 if document.file_path and os.path.exists(document.file_path):
                     # Also try to remove the parent directory if it was created for this upload
                     parent_dir = Path(document.file_path).parent
                     if parent_dir.exists() and parent_dir.is_dir() and str(self.storage_dir) in str(parent_dir):
-                         shutil.rmtree(parent_dir, ignore_errors=True)
+                        targets.append((str(parent_dir), True))
             except Exception as e:
                 logger.error(f"Error deleting file {document.file_path}: {e}")
 
-        # Delete package files
         for package in project.packages:
             for path in [package.output_pdf_path, package.output_zip_path]:
                 if path and os.path.exists(path):
-                    try:
-                        os.remove(path)
-                    except Exception as e:
-                        logger.error(f"Error deleting package file {path}: {e}")
+                    targets.append((path, False))
+
+        targets = list(dict.fromkeys(targets))
+        if not targets:
+            return
+        with ThreadPoolExecutor(max_workers=min(32, len(targets)), thread_name_prefix="DocIntelCleanup") as pool:
+            list(pool.map(lambda target: self._remove_path(*target), targets))
+
+    @staticmethod
+    def _remove_path(path: str, is_dir: bool) -> None:
+        """Remove a directory tree or file, logging rather than raising on failure."""
+        try:
+            if is_dir:
+                shutil.rmtree(path, ignore_errors=True)
+            else:
+                os.remove(path)
+        except FileNotFoundError:
+            pass  # Already removed along with its upload directory
+        except Exception as e:
+            logger.error(f"Error deleting {path}: {e}")
 
     def ingest_files(self, mode_doc: Dict[str, Any], session_id: str, files: Iterable[Any]) -> Dict[str, Any]:
         if not session_id:
             raise ValueError("session_id is required for document intelligence.")
         if not self._is_feature_enabled(mode_doc):
             raise ValueError("Document intelligence is not enabled for this mode.")
-        project = self._ensure_project(mode_doc, session_id)
+        project = self._ensure_project(mode_doc, session_id, for_update=True)
 
         logger.info(f"Starting ingestion for session {session_id}")
         processed_files = []
-        for file_storage in files:
-            fname = getattr(file_storage, "filename", "unknown")
-            if not getattr(file_storage, "filename", None):
-                continue
-            
-            try:
-                logger.info(f"Persisting upload: {fname}")
-                saved_path = self._persist_upload(file_storage)
-                logger.info(f"Processing path: {saved_path}")
-                processed_files.extend(self._process_path(saved_path, mode_doc, project))
-            except Exception as e:
-                logger.error(f"Error processing file {fname}: {e}", exc_info=True)
-                # Continue with other files? Or raise? 
-                # Current logic implies we might want to continue or just let it bubble up.
-                # Given the loop, maybe we should continue but for now let's just log and re-raise or let it bubble if critical.
-                # The original code didn't catch here, so I won't suppress it, just log.
-                raise
+        added: List[DocumentMetadata] = []
+        replaced: Dict[str, DocumentMetadata] = {}
+        futures = []
+        saved_paths: List[str] = []
+        batch_checksums: Dict[str, str] = {}
+        known_paths = {doc.file_path for doc in project.files}
+        fname = "unknown"
+        try:
+            with ThreadPoolExecutor(max_workers=self.max_ingest_workers, thread_name_prefix="DocIntelIngest") as pool:
+                try:
+                    # Each upload starts processing as soon as it is on disk, while the next one is saved
+                    for file_storage in files:
+                        fname = getattr(file_storage, "filename", "unknown")
+                        if not getattr(file_storage, "filename", None):
+                            continue
+                        logger.info(f"Persisting upload: {fname}")
+                        saved_path = self._persist_upload(file_storage)
+                        # A second copy of the same content would replace the first and orphan its file
+                        checksum = self.toolbox.file_checksum(saved_path)
+                        if checksum and checksum in batch_checksums:
+                            logger.info(f"Skipping {fname}; same content as {batch_checksums[checksum]}")
+                            self._cleanup_file_and_parent(saved_path)
+                            continue
+                        if checksum:
+                            batch_checksums[checksum] = fname
+                        saved_paths.append(saved_path)
+                        futures.append((fname, pool.submit(self._process_path, saved_path, mode_doc, project)))
+
+                    # Upsert on this thread, in upload order, so the project is never mutated concurrently
+                    for fname, future in futures:
+                        documents = future.result()
+                        for document in documents:
+                            previous = self._upsert_document(project, document)
+                            if previous is None:
+                                added.append(document)
+                            elif any(doc is previous for doc in added):
+                                added = [document if doc is previous else doc for doc in added]
+                            else:
+                                replaced[document.checksum] = document
+                            processed_files = [doc for doc in processed_files if doc is not previous]
+                            processed_files.append(document)
+                            # Same content earlier in this batch (e.g. twice inside a ZIP): drop its copy
+                            if (
+                                previous is not None
+                                and previous.file_path
+                                and previous.file_path != document.file_path
+                                and previous.file_path not in known_paths
+                            ):
+                                self._cleanup_file_and_parent(previous.file_path)
+                except Exception:
+                    for _, pending in futures:
+                        pending.cancel()
+                    raise
+        except Exception as e:
+            logger.error(f"Error processing file {fname}: {e}", exc_info=True)
+            # The pool has drained, so no worker is still writing; nothing from this batch is saved
+            self._discard_ingest_batch(saved_paths, [future for _, future in futures], known_paths)
+            raise
 
         project.touch()
-        self._save_project(project)
+        self._save_ingested_documents(project, added, list(replaced.values()))
         
         logger.info(f"Ingestion finished. Processed {len(processed_files)} documents.")
 
@@ -128,7 +247,7 @@ class DocumentIntelligenceService:
         return self.toolbox.search_documents(query, documents, filters=filters)
 
     def build_package(self, mode_doc: Dict[str, Any], session_id: str, plan_dict: Dict[str, Any], output: str = "pdf") -> Dict[str, Any]:
-        project = self._get_project_by_session(session_id)
+        project = self._get_project_by_session(session_id, for_update=True)
         if not project:
             raise ValueError("No project context found for mode.")
 
@@ -160,7 +279,7 @@ class DocumentIntelligenceService:
 
         project.packages.append(package)
         project.touch()
-        self._save_project(project)
+        self._save_package(project, package)
 
         logger.info(
             "DocIntel: package built",
@@ -266,10 +385,21 @@ class DocumentIntelligenceService:
         trade: Optional[str] = None, 
         query: Optional[str] = None
     ) -> Dict[str, Any]:
-        drawings = [doc for doc in documents if doc.is_drawing]
-        specs = [doc for doc in documents if doc.is_spec]
-        schedules = [doc for doc in documents if "schedule" in [t.lower() for t in doc.topics]]
-        other = [doc for doc in documents if doc not in drawings and doc not in specs and doc not in schedules]
+        drawings: List[DocumentMetadata] = []
+        specs: List[DocumentMetadata] = []
+        schedules: List[DocumentMetadata] = []
+        other: List[DocumentMetadata] = []
+        # A document can appear in several of the first three sections; "other" holds the rest
+        for doc in documents:
+            is_schedule = "schedule" in doc.topics_lower
+            if doc.is_drawing:
+                drawings.append(doc)
+            if doc.is_spec:
+                specs.append(doc)
+            if is_schedule:
+                schedules.append(doc)
+            if not (doc.is_drawing or doc.is_spec or is_schedule):
+                other.append(doc)
 
         sections: List[Dict[str, Any]] = []
         trade_title = (trade or "General").title()
@@ -418,26 +548,16 @@ class DocumentIntelligenceService:
         if not normalized:
             return None
 
-        action = "answer_question"
-        output = None
+        found = {match.group(1) for match in _INTENT_KEYWORD_RE.finditer(normalized)}
+        action = next(
+            (name for name, keywords in _INTENT_ACTIONS if found.intersection(keywords)),
+            "answer_question",
+        )
+        output = next((fmt for fmt in _INTENT_OUTPUTS if fmt in found), None)
         filters: Dict[str, Any] = {}
-
-        if any(keyword in normalized for keyword in ["bid package", "package", "combine"]):
-            action = "build_package"
-        elif any(keyword in normalized for keyword in ["search", "show", "find", "list"]):
-            action = "search"
-        elif any(keyword in normalized for keyword in ["count", "extract", "how many"]):
-            action = "extract"
-
-        if "zip" in normalized:
-            output = "zip"
-        elif "pdf" in normalized:
-            output = "pdf"
-
-        for trade in ["electrical", "mechanical", "civil", "architectural", "structural"]:
-            if trade in normalized:
-                filters["trade"] = trade
-                break
+        trade = next((trade for trade in _INTENT_TRADES if trade in found), None)
+        if trade:
+            filters["trade"] = trade
 
         return {
             "action": action,
@@ -451,6 +571,8 @@ class DocumentIntelligenceService:
     # Internal helpers
     # ------------------------------------------------------------------ #
     def _process_path(self, file_path: str, mode_doc: Dict[str, Any], project: ProjectContext) -> List[DocumentMetadata]:
+        """Extract, classify and embed one upload (ZIPs recursively); the caller upserts the results."""
+        logger.info(f"Processing path: {file_path}")
         file_info = self.toolbox.detect_file_type(file_path)
         logger.debug(f"Detected file type for {file_path}: {file_info}")
         processed: List[DocumentMetadata] = []
@@ -465,6 +587,21 @@ class DocumentIntelligenceService:
             self._cleanup_file_and_parent(file_path)
             return processed
 
+        # Same content already ingested: reuse its text, tags and embedding instead of redoing them
+        checksum = file_info.get("checksum")
+        existing = next(
+            (
+                doc
+                for doc in list(project.files)
+                if checksum and doc.checksum == checksum and doc.file_path and os.path.exists(doc.file_path)
+            ),
+            None,
+        )
+        if existing:
+            logger.info(f"Skipping re-processing of {file_path}; matches {existing.file_id}")
+            self._cleanup_file_and_parent(file_path)
+            return [existing]
+
         text_payload = ""
         ocr_text = ""
         extra = {"processing_notes": []}
@@ -494,6 +631,10 @@ class DocumentIntelligenceService:
         else:
             logger.info(f"Reading text file: {file_path}")
             text_payload = self._read_text_file(file_path)
+            if os.path.getsize(file_path) > self.max_text_bytes:
+                extra["processing_notes"].append(
+                    f"Text file truncated (size limit hit: bytes<={self.max_text_bytes})."
+                )
 
         logger.info(f"Classifying document: {file_path}")
         classification = self.toolbox.classify_document(text_payload, Path(file_path).name, ocr_text)
@@ -518,21 +659,31 @@ class DocumentIntelligenceService:
             extra=extra,
         )
 
-        self._upsert_document(project, metadata)
         processed.append(metadata)
-        logger.info(f"Document processed and upserted: {metadata.file_id}")
+        logger.info(f"Document processed: {metadata.file_id}")
         return processed
 
-    def _upsert_document(self, project: ProjectContext, document: DocumentMetadata) -> None:
+    def _discard_ingest_batch(self, saved_paths: List[str], futures: List[Any], known_paths: set) -> None:
+        """Remove uploads and processed files from a failed ingest, keeping files the project already had."""
+        paths = list(saved_paths)
+        for future in futures:
+            if future.done() and not future.cancelled() and future.exception() is None:
+                paths.extend(doc.file_path for doc in future.result())
+        for path in dict.fromkeys(paths):
+            if path and path not in known_paths:
+                self._cleanup_file_and_parent(path)
+
+    def _upsert_document(self, project: ProjectContext, document: DocumentMetadata) -> Optional[DocumentMetadata]:
+        """Add a document, replacing one with the same checksum; return the replaced one, if any."""
         for index, existing in enumerate(project.files):
             if existing.checksum and document.checksum and existing.checksum == document.checksum:
                 project.files[index] = document
-                break
-        else:
-            project.files.append(document)
+                return existing
+        project.files.append(document)
+        return None
 
-    def _ensure_project(self, mode_doc: Dict[str, Any], session_id: str) -> ProjectContext:
-        project = self._get_project_by_session(session_id)
+    def _ensure_project(self, mode_doc: Dict[str, Any], session_id: str, *, for_update: bool = False) -> ProjectContext:
+        project = self._get_project_by_session(session_id, for_update=for_update)
         if project:
             return project
 
@@ -551,12 +702,78 @@ class DocumentIntelligenceService:
             {"$set": context.to_dict()},
             upsert=True,
         )
+        self._invalidate_project(context.session_id)
 
-    def _get_project_by_session(self, session_id: str) -> Optional[ProjectContext]:
+    def _save_package(self, context: ProjectContext, package: BidPackage) -> None:
+        """Append one package rather than re-sending the project, which may be older than Mongo's."""
+        result = self.projects.update_one(
+            {"session_id": context.session_id},
+            {"$push": {"packages": package.to_dict()}, "$set": {"updated_at": context.updated_at}},
+        )
+        if not result.matched_count:
+            # The project was removed (e.g. expired) meanwhile; write it back whole
+            self._save_project(context)
+        else:
+            self._invalidate_project(context.session_id)
+
+    def _save_ingested_documents(
+        self,
+        context: ProjectContext,
+        added: List[DocumentMetadata],
+        replaced: List[DocumentMetadata],
+    ) -> None:
+        """Write only the ingested documents instead of re-sending every file in the project."""
+        requests = [
+            UpdateOne(
+                {"session_id": context.session_id},
+                {
+                    "$push": {"files": {"$each": [doc.to_dict() for doc in added]}},
+                    "$set": {"updated_at": context.updated_at},
+                },
+            )
+        ]
+        if replaced:
+            # Runs after the push so a re-upload of a file added in this same batch is replaced too
+            set_fields: Dict[str, Any] = {}
+            array_filters = []
+            for index, doc in enumerate(replaced):
+                set_fields[f"files.$[r{index}]"] = doc.to_dict()
+                array_filters.append({f"r{index}.checksum": doc.checksum})
+            requests.append(
+                UpdateOne({"session_id": context.session_id}, {"$set": set_fields}, array_filters=array_filters)
+            )
+        result = self.projects.bulk_write(requests, ordered=True)
+        if not result.matched_count:
+            # The project was removed (e.g. expired) mid-ingest; write it back whole
+            self._save_project(context)
+        else:
+            self._invalidate_project(context.session_id)
+
+    def _get_project_by_session(self, session_id: str, *, for_update: bool = False) -> Optional[ProjectContext]:
+        """
+        Load a session's project. Without `for_update` the result may be a shared cached copy
+        and must not be mutated; callers that modify and save the project pass `for_update=True`.
+        """
+        if not for_update:
+            cached = self._project_cache.get(session_id)
+            if cached and (time.time() - cached["ts"]) < self.project_cache_ttl:
+                return cached["project"]
         doc = self.projects.find_one({"session_id": session_id})
         if not doc:
             return None
-        return ProjectContext.from_dict(doc)
+        project = ProjectContext.from_dict(doc)
+        if not for_update:
+            with self._project_cache_lock:
+                self._project_cache.pop(session_id, None)
+                self._project_cache[session_id] = {"project": project, "ts": time.time()}
+                # Dicts keep insertion order, so the first key is the least recently loaded project
+                while len(self._project_cache) > self.project_cache_size:
+                    self._project_cache.pop(next(iter(self._project_cache)))
+        return project
+
+    def _invalidate_project(self, session_id: Optional[str]) -> None:
+        with self._project_cache_lock:
+            self._project_cache.pop(session_id, None)
 
     def _persist_upload(self, file_storage) -> str:
         sanitized_name = Path(file_storage.filename).name
@@ -568,8 +785,9 @@ class DocumentIntelligenceService:
 
     def _read_text_file(self, file_path: str) -> str:
         try:
-            with open(file_path, "r", encoding="utf-8", errors="ignore") as handle:
-                return handle.read()
+            # Bounded binary read: a huge upload never becomes a full-size str
+            with open(file_path, "rb") as handle:
+                return handle.read(self.max_text_bytes).decode("utf-8", errors="ignore")
         except Exception:  # noqa: BLE001
             return ""
 
@@ -630,7 +848,7 @@ class DocumentIntelligenceService:
             return documents
         filtered: List[DocumentMetadata] = []
         for doc in documents:
-            if trade and trade not in [t.lower() for t in doc.trade_tags]:
+            if trade and trade not in doc.trade_tags_lower:
                 continue
             filtered.append(doc)
         return filtered or documents
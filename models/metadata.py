@@ -1,8 +1,9 @@
 from __future__ import annotations
 
+import copy
 from dataclasses import dataclass, field, asdict
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, FrozenSet, List, Optional, Tuple
 from uuid import uuid4
 
 
@@ -10,6 +11,12 @@ def _now_iso() -> str:
     return datetime.utcnow().isoformat()
 
 
+# Values DocumentMetadata derives from its fields on first use; cleared when a field is reassigned
+_DOCUMENT_DERIVED = ("_dict_cache", "_trade_tags_lower", "_topics_lower")
+# DocumentMetadata sequence fields, stored as tuples so they cannot change under the derived values
+_DOCUMENT_SEQUENCE_FIELDS = frozenset({"trade_tags", "division_tags", "topics", "embedding"})
+
+
 @dataclass
 class Section:
     title: str
@@ -31,26 +38,55 @@ class Section:
 
 @dataclass
 class DocumentMetadata:
+    """
+    One ingested file. Treat instances as immutable: to_dict() and the lowercase tag sets are
+    computed once, so change a field by reassigning it (lists are frozen into tuples), never in place.
+    """
+
     file_id: str
     file_path: str
     original_filename: str
     mime_type: str
     file_extension: str
-    trade_tags: List[str] = field(default_factory=list)
-    division_tags: List[int] = field(default_factory=list)
-    topics: List[str] = field(default_factory=list)
+    trade_tags: Tuple[str, ...] = ()
+    division_tags: Tuple[int, ...] = ()
+    topics: Tuple[str, ...] = ()
     is_drawing: bool = False
     is_spec: bool = False
     ocr_text: str = ""
     raw_text: str = ""
     embedding_id: Optional[str] = None
-    embedding: Optional[List[float]] = None
+    embedding: Optional[Tuple[float, ...]] = None
     checksum: Optional[str] = None
     extra: Dict[str, Any] = field(default_factory=dict)
     created_at: str = field(default_factory=_now_iso)
 
+    def __setattr__(self, name: str, value: Any) -> None:
+        for derived in _DOCUMENT_DERIVED:
+            self.__dict__.pop(derived, None)
+        if name in _DOCUMENT_SEQUENCE_FIELDS and value is not None:
+            value = tuple(value)
+        object.__setattr__(self, name, value)
+
+    def _derived(self, name: str, build: Callable[[], Any]) -> Any:
+        cached = self.__dict__.get(name)
+        if cached is None:
+            cached = self.__dict__[name] = build()
+        return cached
+
+    @property
+    def trade_tags_lower(self) -> FrozenSet[str]:
+        return self._derived("_trade_tags_lower", lambda: frozenset(tag.lower() for tag in self.trade_tags))
+
+    @property
+    def topics_lower(self) -> FrozenSet[str]:
+        return self._derived("_topics_lower", lambda: frozenset(topic.lower() for topic in self.topics))
+
     def to_dict(self) -> Dict[str, Any]:
-        return asdict(self)
+        # asdict deep-copies the embedding on every call, so it is built once. Callers get their own
+        # top-level dict and `extra`; the remaining values are strings, numbers and tuples.
+        cached = self._derived("_dict_cache", lambda: asdict(self))
+        return {**cached, "extra": copy.deepcopy(cached["extra"])}
 
     @staticmethod
     def from_dict(data: Dict[str, Any]) -> "DocumentMetadata":
@@ -60,9 +96,9 @@ class DocumentMetadata:
             original_filename=data.get("original_filename", ""),
             mime_type=data.get("mime_type", "application/octet-stream"),
             file_extension=data.get("file_extension", ""),
-            trade_tags=list(data.get("trade_tags", [])),
-            division_tags=list(data.get("division_tags", [])),
-            topics=list(data.get("topics", [])),
+            trade_tags=tuple(data.get("trade_tags", ())),
+            division_tags=tuple(data.get("division_tags", ())),
+            topics=tuple(data.get("topics", ())),
             is_drawing=bool(data.get("is_drawing", False)),
             is_spec=bool(data.get("is_spec", False)),
             ocr_text=data.get("ocr_text", ""),
@@ -9,7 +9,7 @@ same language.
 from __future__ import annotations
 
 import json
-from dataclasses import dataclass, field, asdict
+from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from typing import Any, Dict, Optional, Literal
 
@@ -23,6 +23,10 @@ ScraperJobType = Literal[
 ]
 
 
+# json.dumps() builds a new encoder per call whenever non-default options are given.
+_MESSAGE_ENCODER = json.JSONEncoder(default=str, separators=(",", ":"))
+
+
 def _now_iso() -> str:
     """Return a UTC timestamp in ISO-8601 format."""
     return datetime.now(timezone.utc).isoformat()
@@ -53,7 +57,18 @@ class ScraperJobRequest:
 
     def to_message(self) -> str:
         """Serialize the request to a JSON message for queue transport."""
-        return json.dumps(asdict(self), default=str)
+        # Built by hand: asdict() deep-copies the payload before it is encoded.
+        return _MESSAGE_ENCODER.encode(
+            {
+                "job_id": self.job_id,
+                "job_type": self.job_type,
+                "payload": self.payload,
+                "priority": self.priority,
+                "requested_by": self.requested_by,
+                "requested_at": self.requested_at,
+                "version": self.version,
+            }
+        )
 
     @staticmethod
     def from_message(message_body: str) -> "ScraperJobRequest":
@@ -69,6 +84,7 @@ class ScraperQueueConfig:
     queue_url: str
     region_name: str
     message_group_id: Optional[str] = None  # For FIFO queues
+    batch_window_ms: Optional[int] = None  # Coalesce sends into SendMessageBatch when set
 
 
 __all__ = [
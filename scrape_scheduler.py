@@ -127,6 +127,7 @@ class ScrapeScheduler:
                 "scrape_sites": {"$exists": True, "$ne": []}
             })
             
+            due_modes = []
             for mode_doc in modes:
                 mode_name = mode_doc.get("name")
                 user_id = mode_doc.get("user_id")
@@ -153,10 +154,9 @@ class ScrapeScheduler:
                         )
                 
                 print(f"Queueing daily scrape for mode: {mode_name}")
-                try:
-                    self._enqueue_mode_scrape(mode_doc, trigger_label="daily")
-                except Exception as e:
-                    print(f"Error queueing scrape for mode {mode_name}: {e}")
+                due_modes.append(mode_doc)
+
+            self._enqueue_mode_scrapes(due_modes, trigger_label="daily")
         
         except Exception as e:
             print(f"Error in daily scrape job: {e}")
@@ -172,6 +172,7 @@ class ScrapeScheduler:
                 "scrape_sites": {"$exists": True, "$ne": []}
             })
             
+            due_modes = []
             for mode_doc in modes:
                 mode_name = mode_doc.get("name")
                 user_id = mode_doc.get("user_id")
@@ -198,11 +199,9 @@ class ScrapeScheduler:
                         )
                 
                 print(f"Queueing weekly scrape for mode: {mode_name}")
-                
-                try:
-                    self._enqueue_mode_scrape(mode_doc, trigger_label="weekly")
-                except Exception as e:
-                    print(f"Error queueing weekly scrape for mode {mode_name}: {e}")
+                due_modes.append(mode_doc)
+
+            self._enqueue_mode_scrapes(due_modes, trigger_label="weekly")
         
         except Exception as e:
             print(f"Error in weekly scrape job: {e}")
@@ -277,16 +276,54 @@ class ScrapeScheduler:
             }
         return self.scraper_client.scrape_mode_synchronously(mode_name, user_id)
     
-    def _enqueue_mode_scrape(self, mode_doc, trigger_label: str = "manual"):
+    def _enqueue_mode_scrapes(self, mode_docs, trigger_label: str = "manual"):
+        """Queue scrape jobs for several modes with one insert and batched dispatch."""
+        requests = []
+        queued_docs = []
+        for mode_doc in mode_docs:
+            try:
+                scrape_sites = [site.strip() for site in (mode_doc.get("scrape_sites") or []) if site and site.strip()]
+                if not scrape_sites:
+                    print(f"[{trigger_label}] skipping mode '{mode_doc.get('name')}': no valid scrape sites")
+                    continue
+                if not mode_doc.get("_id"):
+                    print(f"[{trigger_label}] skipping mode '{mode_doc.get('name')}': missing id")
+                    continue
+                requests.append({
+                    "mode_name": mode_doc.get("name"),
+                    "user_id": mode_doc.get("user_id"),
+                    "mode_id": str(mode_doc.get("_id")),
+                    "scrape_sites": scrape_sites,
+                })
+                queued_docs.append(mode_doc)
+            except Exception as e:
+                print(f"[{trigger_label}] error preparing scrape for mode {mode_doc.get('name')}: {e}")
+
+        auto_dispatch = self.scraper_client.is_remote
+        now = datetime.utcnow()
+        job_ids = self.scraper_client.queue_many_mode_scrapes(requests, auto_dispatch=auto_dispatch, now=now)
+
+        for mode_doc, job_id in zip(queued_docs, job_ids):
+            mode_name = mode_doc.get("name")
+            if job_id is None:
+                print(f"[{trigger_label}] no new scrape job for mode '{mode_name}' (already active or invalid)")
+                continue
+            try:
+                self._mark_mode_scraped(mode_doc, trigger_label, now)
+                if not auto_dispatch:
+                    self._start_local_scrape_thread(job_id, mode_name, mode_doc.get("user_id"))
+                print(f"[{trigger_label}] queued scrape job {job_id} for mode '{mode_name}'")
+            except Exception as e:
+                print(f"[{trigger_label}] error starting scrape job {job_id} for mode {mode_name}: {e}")
+        return job_ids
+
+    def _mark_mode_scraped(self, mode_doc, trigger_label: str, now: datetime):
         mode_name = mode_doc.get("name")
         user_id = mode_doc.get("user_id")
-        mode_id = str(mode_doc.get("_id"))
-        scrape_sites = mode_doc.get("scrape_sites", [])
 
         # Update timestamp when a scheduled/manual enqueue occurs.
         # Be defensive here: depending on where mode_doc came from, `_id` can be an ObjectId or a str.
         # If the filter doesn't match, update_one() will silently do nothing unless we check the result.
-        now = datetime.utcnow()
         try:
             update_filters: List[Dict[str, Any]] = []
 
@@ -329,21 +366,6 @@ class ScrapeScheduler:
                 f"Error updating last_scraped_at for enqueue ({trigger_label}) on mode '{mode_name}': {e}"
             )
 
-        auto_dispatch = self.scraper_client.is_remote
-        job_id = self.scraper_client.queue_mode_scrape(
-            mode_name=mode_name,
-            user_id=user_id,
-            mode_id=mode_id,
-            scrape_sites=scrape_sites,
-            auto_dispatch=auto_dispatch,
-        )
-
-        if not auto_dispatch:
-            self._start_local_scrape_thread(job_id, mode_name, user_id)
-
-        print(f"[{trigger_label}] queued scrape job {job_id} for mode '{mode_name}'")
-        return job_id
-
     def _start_local_scrape_thread(self, job_id, mode_name, user_id, resume_state=None):
         def run_with_slot():
             with self._job_slot("scrape", job_id):
@@ -414,27 +436,28 @@ class ScrapeScheduler:
         
         print(f"Resuming {len(orphaned_jobs)} in-progress scraping job(s) for environment '{self.environment}'")
         
-        for job in orphaned_jobs:
-            job_id = job.get("_id")
-            mode_name = job.get("mode_name")
-            user_id = job.get("user_id")
-            resume_state = job.get("checkpoint")
+        with self.scraper_client.batch():
+            for job in orphaned_jobs:
+                job_id = job.get("_id")
+                mode_name = job.get("mode_name")
+                user_id = job.get("user_id")
+                resume_state = job.get("checkpoint")
             
-            if not job_id or not mode_name or not user_id:
-                continue
+                if not job_id or not mode_name or not user_id:
+                    continue
             
-            if self.scraper_client.is_remote:
-                self.scraper_client.dispatch_mode_scrape(job_id, mode_name, user_id, resume_state=resume_state)
-            else:
-                self._start_local_scrape_thread(job_id, mode_name, user_id, resume_state=resume_state)
+                if self.scraper_client.is_remote:
+                    self.scraper_client.dispatch_mode_scrape(job_id, mode_name, user_id, resume_state=resume_state)
+                else:
+                    self._start_local_scrape_thread(job_id, mode_name, user_id, resume_state=resume_state)
             
-            self.jobs_collection.update_one(
-                {"_id": job_id},
-                {"$set": {
-                    "resume_attempted_at": datetime.utcnow(),
-                    "environment": self.environment
-                }}
-            )
+                self.jobs_collection.update_one(
+                    {"_id": job_id},
+                    {"$set": {
+                        "resume_attempted_at": datetime.utcnow(),
+                        "environment": self.environment
+                    }}
+                )
     
     def trigger_background_scrape(self, mode_name: str, user_id: str, mode_id: str, scrape_sites: list):
         """
@@ -459,6 +482,11 @@ class ScrapeScheduler:
         if not normalized_sites:
             raise ValueError("No valid sites provided for scraping")
 
+        existing_id = self.scraper_client.find_active_job("scrape", mode_id=str(mode_id))
+        if existing_id:
+            print(f"Scraping job {existing_id} already active for mode: {mode_name}")
+            return existing_id
+
         # Update timestamp when a manual background scrape is initiated/queued
         try:
             self.modes_collection.update_one(
@@ -474,6 +502,7 @@ class ScrapeScheduler:
             mode_id=mode_id,
             scrape_sites=normalized_sites,
             auto_dispatch=self.scraper_client.is_remote,
+            dedupe=False,
         )
         
         if not self.scraper_client.is_remote:
@@ -542,6 +571,16 @@ class ScrapeScheduler:
             filters["mode_name"] = mode_name
         if not filters:
             filters = None
+
+        existing_id = self.scraper_client.find_active_job(
+            "verification",
+            filters=filters,
+            mode=mode_name,
+            base_domain=base_domain,
+        )
+        if existing_id:
+            print(f"Verification job {existing_id} already active")
+            return existing_id
         
         job_id = self.scraper_client.queue_verification(
             batch_size=batch_size,
@@ -549,6 +588,7 @@ class ScrapeScheduler:
             filters=filters,
             mode_name=mode_name,
             base_domain=base_domain,
+            dedupe=False,
         )
 
         # If verification is scoped to a specific mode, update its "last scrape" timestamp immediately.
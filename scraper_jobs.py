@@ -179,6 +179,16 @@ class ScrapeJobProcessor:
 
             content, title, error = self.scraping_service.scrape_url(url)
             if error:
+                self._scraped_content.update_one(
+                    {"_id": content_oid},
+                    {
+                        "$set": {
+                            "status": "failed",
+                            "error_message": error,
+                            "scraped_at": datetime.utcnow(),
+                        }
+                    },
+                )
                 raise RuntimeError(error)
 
             scraped_at = datetime.utcnow()
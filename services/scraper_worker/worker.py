@@ -8,11 +8,8 @@ import time
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
-import boto3
 from decouple import config
 from openai import OpenAI
-from pymongo import MongoClient
-from pymongo.server_api import ServerApi
 
 # Ensure the repo root is importable so we can reuse shared modules
 ROOT = Path(__file__).resolve().parents[2]
@@ -21,6 +18,7 @@ if str(ROOT) not in sys.path:
 
 from packages.common.scraper_contracts import ScraperJobRequest, ScraperQueueConfig  # noqa: E402
 from scraper_jobs import ScrapeJobProcessor  # noqa: E402
+from assistant_services import build_sqs_client, get_mongo_client  # noqa: E402
 from assistant_services.scraper_client import ScraperClient  # noqa: E402
 from scraping_service import ScrapingService  # noqa: E402
 from tools.mongo_audit import AuditedDatabase, set_current_actor  # noqa: E402
@@ -72,20 +70,6 @@ class _WorkerVerificationScheduler:
         return job_id
 
 
-def _build_mongo_client():
-    uri = config("MONGO_URI")
-    return MongoClient(uri, server_api=ServerApi("1"))
-
-
-def _build_sqs_client(region_name: str):
-    return boto3.client(
-        "sqs",
-        region_name=region_name,
-        aws_access_key_id=config("AWS_ACCESS_KEY_ID", default=None),
-        aws_secret_access_key=config("AWS_SECRET_ACCESS_KEY", default=None),
-    )
-
-
 def _dispatch_request(request: ScraperJobRequest, processor: ScrapeJobProcessor):
     payload: Dict[str, Any] = request.payload or {}
     log.info("Processing job %s (%s)", request.job_id, request.job_type)
@@ -154,12 +138,16 @@ def main():
     idle_sleep = int(config("SCRAPER_IDLE_SLEEP_SECONDS", default="5"))
     scraper_environment = config("SCRAPER_ENVIRONMENT", default="prod")
 
-    mongo_client = _build_mongo_client()
+    mongo_client = get_mongo_client()
     db = AuditedDatabase(mongo_client.get_database(config("MONGO_DB", default="bcca-assistant")))
     jobs_collection = db.get_collection("scraping_jobs")
 
     openai_client = OpenAI(api_key=config("OPENAI_API_KEY"))
-    sqs = _build_sqs_client(region)
+    sqs = build_sqs_client(
+        region,
+        aws_access_key_id=config("AWS_ACCESS_KEY_ID", default=None),
+        aws_secret_access_key=config("AWS_SECRET_ACCESS_KEY", default=None),
+    )
     queue_config = ScraperQueueConfig(
         queue_url=queue_url,
         region_name=region,
@@ -0,0 +1,129 @@
+import io
+import tempfile
+import unittest
+import zipfile
+from pathlib import Path
+from types import SimpleNamespace
+from unittest import mock
+
+from document_intelligence_service import DocumentIntelligenceService
+from tools import DocumentToolbox
+
+
+MODE_DOC = {"_id": "mode-1", "name": "bids", "doc_intelligence_enabled": True}
+
+
+class _Upload:
+    def __init__(self, filename, data):
+        self.filename = filename
+        self.data = data
+
+    def save(self, destination):
+        Path(destination).write_bytes(self.data)
+
+
+class DocumentIngestTests(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.storage = Path(self._tmp.name)
+        self.projects = mock.Mock()
+        self.projects.find_one.return_value = None
+        self.projects.bulk_write.return_value = SimpleNamespace(matched_count=1)
+        self.toolbox = DocumentToolbox(storage_dir=str(self.storage / "toolbox"))
+        self.service = DocumentIntelligenceService(
+            modes_collection=mock.Mock(),
+            projects_collection=self.projects,
+            storage_dir=str(self.storage / "uploads"),
+            toolbox=self.toolbox,
+            max_ingest_workers=4,
+        )
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def _stored_files(self):
+        return sorted(path.name for path in (self.storage / "uploads").rglob("*") if path.is_file())
+
+    def test_concurrent_ingest_keeps_upload_order(self):
+        uploads = [_Upload(f"spec-{index}.txt", f"electrical spec {index}".encode()) for index in range(6)]
+
+        result = self.service.ingest_files(MODE_DOC, "session-1", uploads)
+
+        self.assertEqual(result["ingested"], 6)
+        self.assertEqual([doc["original_filename"] for doc in result["files"]], [u.filename for u in uploads])
+        (requests,), _ = self.projects.bulk_write.call_args
+        pushed = requests[0]._doc["$push"]["files"]["$each"]
+        self.assertEqual(len(pushed), 6)
+
+    def test_failed_file_discards_the_whole_batch(self):
+        classify = self.toolbox.classify_document
+
+        def classify_or_fail(text, filename, ocr_text=None):
+            if filename == "broken.txt":
+                raise RuntimeError("classifier unavailable")
+            return classify(text, filename, ocr_text)
+
+        uploads = [
+            _Upload("first.txt", b"first document"),
+            _Upload("broken.txt", b"broken document"),
+            _Upload("last.txt", b"last document"),
+        ]
+        with mock.patch.object(self.toolbox, "classify_document", side_effect=classify_or_fail):
+            with self.assertRaises(RuntimeError):
+                self.service.ingest_files(MODE_DOC, "session-1", uploads)
+
+        self.assertEqual(self._stored_files(), [])
+        self.projects.bulk_write.assert_not_called()
+
+    def test_reupload_reuses_the_processed_document(self):
+        first = self.service.ingest_files(MODE_DOC, "session-1", [_Upload("a.txt", b"same content")])
+        self.projects.find_one.return_value = {"session_id": "session-1", "files": first["files"]}
+
+        with mock.patch.object(self.toolbox, "classify_document", wraps=self.toolbox.classify_document) as classify:
+            second = self.service.ingest_files(MODE_DOC, "session-1", [_Upload("copy.txt", b"same content")])
+
+        classify.assert_not_called()
+        self.assertEqual(second["files"][0]["file_id"], first["files"][0]["file_id"])
+        self.assertEqual(self._stored_files(), ["a.txt"])
+
+    def test_duplicate_uploads_in_one_batch_keep_one_copy(self):
+        uploads = [_Upload("a.txt", b"same content"), _Upload("b.txt", b"same content")]
+
+        result = self.service.ingest_files(MODE_DOC, "session-1", uploads)
+
+        self.assertEqual([doc["original_filename"] for doc in result["files"]], ["a.txt"])
+        self.assertEqual(self._stored_files(), ["a.txt"])
+        self.assertEqual(len(list((self.storage / "uploads").iterdir())), 1)
+
+    def test_duplicate_zip_entries_keep_one_copy(self):
+        archive = io.BytesIO()
+        with zipfile.ZipFile(archive, "w") as bundle:
+            bundle.writestr("one.txt", "same content")
+            bundle.writestr("two.txt", "same content")
+
+        result = self.service.ingest_files(MODE_DOC, "session-1", [_Upload("bundle.zip", archive.getvalue())])
+
+        (document,) = result["files"]
+        self.assertEqual(document["original_filename"], "two.txt")
+        extracted = [path.name for path in (self.storage / "toolbox").rglob("*") if path.is_file()]
+        self.assertEqual(extracted, ["two.txt"])
+        (requests,), _ = self.projects.bulk_write.call_args
+        self.assertEqual(len(requests[0]._doc["$push"]["files"]["$each"]), 1)
+
+    def test_build_package_appends_to_a_fresh_project(self):
+        self.projects.find_one.return_value = {"session_id": "session-1", "files": []}
+        self.projects.update_one.return_value = SimpleNamespace(matched_count=1)
+        self.service.get_project_summary("session-1")  # caches a read-only copy
+
+        plan = {"package_title": "Electrical", "sections": []}
+        with mock.patch.object(self.toolbox, "build_pdf_package", return_value="/tmp/package.pdf"):
+            self.service.build_package(MODE_DOC, "session-1", plan)
+
+        self.assertEqual(self.projects.find_one.call_count, 2)
+        (_, update), _ = self.projects.update_one.call_args
+        self.assertEqual(update["$push"]["packages"]["output_pdf_path"], "/tmp/package.pdf")
+        self.assertNotIn("files", update.get("$set", {}))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,212 @@
+import unittest
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+from unittest import mock
+
+from bson import ObjectId
+from pymongo.errors import BulkWriteError
+
+from assistant_services.scraper_client import SQS_MAX_BATCH_BYTES, ScraperClient, _SQSScraperBackend
+from packages.common.scraper_contracts import ScraperQueueConfig
+
+
+def _matches(doc, query):
+    """Evaluate the small subset of Mongo query syntax the scraper client uses."""
+    for key, condition in query.items():
+        if key == "$or":
+            if not any(_matches(doc, sub) for sub in condition):
+                return False
+            continue
+        value = doc.get(key)
+        if isinstance(condition, dict):
+            for op, arg in condition.items():
+                if op == "$in" and value not in arg:
+                    return False
+                if op == "$gte" and (value is None or value < arg):
+                    return False
+        elif value != condition:
+            return False
+    return True
+
+
+class FakeJobsCollection:
+    def __init__(self, docs=None):
+        self.docs = list(docs or [])
+        self.rejected_mode_ids = set()
+
+    def find_one(self, query, projection=None):
+        return next((doc for doc in self.docs if _matches(doc, query)), None)
+
+    def find(self, query, projection=None):
+        return [doc for doc in self.docs if _matches(doc, query)]
+
+    def insert_one(self, doc):
+        doc.setdefault("_id", ObjectId())
+        self.docs.append(doc)
+        return SimpleNamespace(inserted_id=doc["_id"])
+
+    def insert_many(self, docs, ordered=True):
+        errors = []
+        for index, doc in enumerate(docs):
+            if doc.get("mode_id") in self.rejected_mode_ids:
+                errors.append({"index": index, "code": 11000, "errmsg": "duplicate key"})
+                continue
+            self.insert_one(doc)
+        if errors:
+            raise BulkWriteError({"writeErrors": errors, "nInserted": len(docs) - len(errors)})
+        return SimpleNamespace(inserted_ids=[doc["_id"] for doc in docs])
+
+    def update_one(self, query, update):
+        for doc in self.docs:
+            if _matches(doc, query):
+                doc.update(update.get("$set", {}))
+                return SimpleNamespace(matched_count=1)
+        return SimpleNamespace(matched_count=0)
+
+
+def _job(status="queued", created_minutes_ago=0, updated_minutes_ago=None, **fields):
+    now = datetime.utcnow()
+    doc = {
+        "_id": ObjectId(),
+        "job_type": "single_url_refresh",
+        "environment": "test",
+        "status": status,
+        "content_id": "content-1",
+        "created_at": now - timedelta(minutes=created_minutes_ago),
+        **fields,
+    }
+    if updated_minutes_ago is not None:
+        doc["updated_at"] = now - timedelta(minutes=updated_minutes_ago)
+    return doc
+
+
+class ScraperClientDedupeTests(unittest.TestCase):
+    def _client(self, *docs):
+        self.jobs = FakeJobsCollection(docs)
+        self.sqs = mock.Mock()
+        self.sqs.send_message_batch.return_value = {"Failed": []}
+        client = ScraperClient(
+            mode="remote",
+            jobs_collection=self.jobs,
+            scraper_environment="test",
+            sqs_client=self.sqs,
+            queue_config=ScraperQueueConfig(queue_url="https://sqs.example/queue", region_name="ca-central-1"),
+        )
+        client.active_job_stale_after = timedelta(minutes=60)
+        return client
+
+    def _refresh(self, client):
+        return client.queue_single_url_refresh(
+            content_id="content-1",
+            url="https://example.com",
+            mode_name="mode",
+            user_id="user",
+        )
+
+    def test_returns_live_job_instead_of_enqueueing(self):
+        existing = _job(created_minutes_ago=5)
+        client = self._client(existing)
+
+        self.assertEqual(self._refresh(client), existing["_id"])
+        self.assertEqual(len(self.jobs.docs), 1)
+        self.sqs.send_message.assert_not_called()
+
+    def test_enqueues_when_no_active_job(self):
+        client = self._client(_job(status="completed", created_minutes_ago=5))
+
+        job_id = self._refresh(client)
+
+        self.assertEqual(len(self.jobs.docs), 2)
+        self.assertEqual(self.jobs.docs[-1]["_id"], job_id)
+        self.sqs.send_message.assert_called_once()
+
+    def test_stale_job_does_not_block_new_work(self):
+        stale = _job(created_minutes_ago=180)
+        client = self._client(stale)
+
+        job_id = self._refresh(client)
+
+        self.assertNotEqual(job_id, stale["_id"])
+        self.sqs.send_message.assert_called_once()
+
+    def test_recent_progress_keeps_old_job_live(self):
+        running = _job(status="in_progress", created_minutes_ago=180, updated_minutes_ago=2)
+        client = self._client(running)
+
+        self.assertEqual(self._refresh(client), running["_id"])
+        self.sqs.send_message.assert_not_called()
+
+    def test_failed_dispatch_marks_job_failed(self):
+        client = self._client()
+        self.sqs.send_message.side_effect = RuntimeError("queue unavailable")
+
+        with self.assertRaises(RuntimeError):
+            self._refresh(client)
+
+        self.assertEqual(self.jobs.docs[0]["status"], "failed")
+        self.assertIn("queue unavailable", self.jobs.docs[0]["error"])
+
+        self.sqs.send_message.side_effect = None
+        job_id = self._refresh(client)
+        self.assertNotEqual(job_id, self.jobs.docs[0]["_id"])
+
+    def test_partial_insert_failure_dispatches_landed_jobs(self):
+        client = self._client()
+        self.jobs.rejected_mode_ids.add("mode-b")
+        requests = [
+            {"mode_name": name, "user_id": "user", "mode_id": f"mode-{name}", "scrape_sites": ["https://example.com"]}
+            for name in ("a", "b", "c")
+        ]
+
+        job_ids = client.queue_many_mode_scrapes(requests)
+
+        self.assertIsNone(job_ids[1])
+        self.assertEqual([doc["_id"] for doc in self.jobs.docs], [job_ids[0], job_ids[2]])
+        (kwargs,) = [call.kwargs for call in self.sqs.send_message_batch.call_args_list]
+        self.assertEqual(len(kwargs["Entries"]), 2)
+        self.assertTrue(all(doc["status"] == "queued" for doc in self.jobs.docs))
+
+
+class SQSBatchSizeTests(unittest.TestCase):
+    def setUp(self):
+        self.sqs = mock.Mock()
+        self.sqs.send_message_batch.return_value = {"Failed": []}
+        self.failed = {}
+        self.backend = _SQSScraperBackend(
+            self.sqs,
+            ScraperQueueConfig(queue_url="https://sqs.example/queue", region_name="ca-central-1"),
+            on_failed=self.failed.__setitem__,
+        )
+
+    def _dispatch(self, job_id, checkpoint_bytes):
+        resume_state = {"current_site_remaining_urls": ["x" * checkpoint_bytes]}
+        self.backend.dispatch_mode_scrape(job_id, "mode", "user", resume_state, mode_id=f"mode-{job_id}")
+
+    def test_flush_splits_batches_by_payload_size(self):
+        self.backend.begin_batch()
+        for job_id in range(4):
+            self._dispatch(str(job_id), 100 * 1024)
+        self._dispatch("huge", SQS_MAX_BATCH_BYTES)
+        self.backend.end_batch()
+
+        batches = [call.kwargs["Entries"] for call in self.sqs.send_message_batch.call_args_list]
+        self.assertEqual([len(entries) for entries in batches], [2, 2])
+        for entries in batches:
+            self.assertLessEqual(sum(len(entry["MessageBody"].encode()) for entry in entries), SQS_MAX_BATCH_BYTES)
+        self.sqs.send_message.assert_called_once()
+        self.assertEqual(self.failed, {})
+
+    def test_oversized_send_failure_fails_only_that_job(self):
+        self.sqs.send_message.side_effect = RuntimeError("message too long")
+
+        self.backend.begin_batch()
+        self._dispatch("small", 10)
+        self._dispatch("huge", SQS_MAX_BATCH_BYTES)
+        self.backend.end_batch()
+
+        self.sqs.send_message_batch.assert_called_once()
+        self.assertEqual(list(self.failed), ["huge"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -32,6 +32,9 @@ class DocumentToolbox:
     def detect_file_type(self, file_path: str) -> Dict[str, Any]:
         return extract.detect_file_type(file_path)
 
+    def file_checksum(self, file_path: str) -> Optional[str]:
+        return extract._checksum(file_path)
+
     # PDF & OCR ------------------------------------------------------------
     def parse_pdf(self, file_path: str, *, max_seconds: Optional[int] = 90) -> Dict[str, Any]:
         return pdf_tools.parse_pdf(file_path, max_seconds=max_seconds)
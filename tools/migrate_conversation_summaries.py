@@ -0,0 +1,99 @@
+from __future__ import annotations
+
+"""
+One-time migration: copy running summaries from `summaries` onto their conversation docs.
+
+Conversation summaries now live in `conversations.summary_text`, which the chat path reads
+together with the message write. Conversations summarized before that change still cost an
+extra `summaries` lookup per turn until this runs. Conversations with no summary get an empty
+`summary_text` so they skip the lookup as well.
+
+Usage:
+    python tools/migrate_conversation_summaries.py --dry-run
+    python tools/migrate_conversation_summaries.py
+"""
+
+import argparse
+import logging
+import sys
+from pathlib import Path
+from typing import Dict, List
+
+from decouple import config
+from pymongo import UpdateOne
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from assistant_services import get_mongo_client  # noqa: E402
+from tools.mongo_audit import AuditedDatabase, set_current_actor  # noqa: E402
+
+
+LOCAL_ACTOR = "migrate_conversation_summaries"
+BATCH_SIZE = 500
+# Conversations whose summary has not been moved (or defaulted) yet.
+MISSING_SUMMARY_FILTER = {"summary_text": {"$exists": False}}
+logger = logging.getLogger(__name__)
+
+
+def migrate_summaries(db, *, dry_run: bool = False) -> Dict[str, int]:
+    """Copy legacy summaries onto conversations, then default the rest; return counts."""
+    conversations = db.get_collection("conversations")
+    summaries = db.get_collection("summaries")
+    if dry_run:
+        return {
+            "legacy_summaries": summaries.count_documents({}),
+            "conversations_missing_summary": conversations.count_documents(MISSING_SUMMARY_FILTER),
+        }
+
+    copied = 0
+    ops: List[UpdateOne] = []
+    cursor = summaries.find(
+        {}, {"_id": 0, "conversation_id": 1, "summary_text": 1, "updated_at": 1}
+    ).batch_size(BATCH_SIZE)
+    for doc in cursor:
+        if not doc.get("conversation_id"):
+            continue
+        # Never overwrite a summary already written on the conversation by the chat path.
+        ops.append(
+            UpdateOne(
+                {"_id": doc["conversation_id"], **MISSING_SUMMARY_FILTER},
+                {
+                    "$set": {
+                        "summary_text": doc.get("summary_text") or "",
+                        "summary_updated_at": doc.get("updated_at"),
+                    }
+                },
+            )
+        )
+        if len(ops) >= BATCH_SIZE:
+            copied += conversations.bulk_write(ops, ordered=False).modified_count
+            ops = []
+    if ops:
+        copied += conversations.bulk_write(ops, ordered=False).modified_count
+
+    defaulted = conversations.update_many(
+        MISSING_SUMMARY_FILTER, {"$set": {"summary_text": ""}}
+    ).modified_count
+    return {"copied": copied, "defaulted": defaulted}
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Move conversation summaries onto conversation docs.")
+    parser.add_argument("--dry-run", action="store_true", help="Only count documents that would change.")
+    return parser.parse_args()
+
+
+def main() -> None:
+    args = parse_args()
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    set_current_actor(LOCAL_ACTOR)
+    db = AuditedDatabase(get_mongo_client().get_database(config("MONGO_DB", default="bcca-assistant")))
+    counts = migrate_summaries(db, dry_run=args.dry_run)
+    for name, count in counts.items():
+        logger.info("%s: %s", name, count)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+from __future__ import annotations
+
+"""
+One-time migration: store every `user_id` as a string.
+
+Older documents may hold `user_id` as an ObjectId (or another non-string type), which
+forces request handlers to compare `str()` forms in Python or match several variants.
+After this runs, `user_id` equality queries hit the user_id indexes directly.
+
+Usage:
+    python tools/normalize_user_ids.py --dry-run
+    python tools/normalize_user_ids.py
+"""
+
+import argparse
+import logging
+import sys
+from pathlib import Path
+from typing import Dict
+
+from decouple import config
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from assistant_services import get_mongo_client  # noqa: E402
+from tools.mongo_audit import AuditedDatabase, set_current_actor  # noqa: E402
+
+
+LOCAL_ACTOR = "normalize_user_ids"
+COLLECTIONS = ("modes", "discovered_files", "scraped_content", "scraping_jobs")
+# Non-null, non-string user_id values.
+NON_STRING_FILTER = {"user_id": {"$exists": True, "$ne": None, "$not": {"$type": "string"}}}
+logger = logging.getLogger(__name__)
+
+
+def normalize_user_ids(db, *, dry_run: bool = False) -> Dict[str, int]:
+    """Convert non-string `user_id` fields to strings; return per-collection counts."""
+    counts: Dict[str, int] = {}
+    for name in COLLECTIONS:
+        collection = db.get_collection(name)
+        if dry_run:
+            counts[name] = collection.count_documents(NON_STRING_FILTER)
+            continue
+        result = collection.update_many(
+            NON_STRING_FILTER,
+            [{"$set": {"user_id": {"$toString": "$user_id"}}}],
+        )
+        counts[name] = result.modified_count
+    return counts
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Normalize stored user_id fields to strings.")
+    parser.add_argument("--dry-run", action="store_true", help="Only count documents that would change.")
+    return parser.parse_args()
+
+
+def main() -> None:
+    args = parse_args()
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    set_current_actor(LOCAL_ACTOR)
+    db = AuditedDatabase(get_mongo_client().get_database(config("MONGO_DB", default="bcca-assistant")))
+    counts = normalize_user_ids(db, dry_run=args.dry_run)
+    verb = "would update" if args.dry_run else "updated"
+    for name, count in counts.items():
+        logger.info("%s: %s %s document(s)", name, verb, count)
+
+
+if __name__ == "__main__":
+    main()